@@ -18,5 +18,65 @@ class Settings(BaseSettings):
     # variables.
     SPECIAL_ADMIN_STUDENT_ID: str | None = None
     SPECIAL_ADMIN_PASSWORD: str | None = None
+    # Shared Chromium pool (utils/browser_pool.py). At most
+    # BROWSER_POOL_MAX_CONTEXTS per-user contexts are kept alive; contexts
+    # idle for longer than BROWSER_POOL_IDLE_TTL seconds are closed by the
+    # health check that runs every BROWSER_POOL_HEALTH_INTERVAL seconds.
+    BROWSER_POOL_MAX_CONTEXTS: int = 8
+    BROWSER_POOL_IDLE_TTL: int = 600
+    BROWSER_POOL_HEALTH_INTERVAL: int = 60
+    # A PLATO cookie confirmed valid within this many seconds is trusted
+    # without re-probing login.php (utils/session_cache.py).
+    PLATO_SESSION_TTL: int = 300
+    # Decrypted storage states are kept in memory for this many seconds
+    # before being re-read from the plato_sessions table (utils/plato_cookie.py).
+    COOKIE_CACHE_TTL: int = 600
+    # Number of pre-opened onestop search tabs used concurrently for
+    # schedule lookups (services/onestop_catalog.py).
+    ONESTOP_MAX_PAGES: int = 4
+    # A lecture's stored timetable is reused without asking onestop when it
+    # was fetched in the current semester and within this many days.
+    SCHEDULE_CACHE_MAX_AGE_DAYS: int = 30
+    # Finished lecture sync jobs stay queryable (status / progress stream)
+    # for this many seconds (services/lecture_sync.py).
+    LECTURE_SYNC_JOB_TTL: int = 600
+    # HTML parser used by every scraping path (utils/html_parser.py):
+    # "lxml" (falls back to "html.parser" when lxml is not installed) or
+    # "html.parser". HTML_PARSER_STRAIN limits the tree to the elements each
+    # parser needs; turn it off to compare against full-document parsing.
+    HTML_PARSER_BACKEND: str = "lxml"
+    HTML_PARSER_STRAIN: bool = True
+    # The building/room autocomplete index (utils/location_search.py) is built
+    # at startup and re-reads known rooms from lecture_location in the
+    # background every this many seconds.
+    LOCATION_SEARCH_REFRESH: int = 600
+    # Resource blocking for pooled Playwright contexts (utils/lean_page.py).
+    # LEAN_PAGE_RULES can be overridden with a JSON object in the environment.
+    LEAN_PAGE_ENABLED: bool = True
+    LEAN_PAGE_RULES: dict = {
+        "plato.pusan.ac.kr": {
+            "block_types": ["image", "font", "media"],
+            "deny": [],
+            "allow": [],
+        },
+        "onestop.pusan.ac.kr": {
+            "block_types": ["image", "font", "media"],
+            "deny": [],
+            "allow": [],
+        },
+        "*": {
+            "block_types": ["image", "font", "media", "stylesheet"],
+            "deny": [
+                "google-analytics.com",
+                "googletagmanager.com",
+                "doubleclick.net",
+                "facebook.net",
+            ],
+            "allow": [],
+        },
+    }
+    # Connection pool for browserless PLATO page reads (utils/plato_http.py).
+    PLATO_HTTP_MAX_CONNECTIONS: int = 20
+    PLATO_HTTP_TIMEOUT: float = 10.0
 
 settings = Settings()
\ No newline at end of file
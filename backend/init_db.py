@@ -1,9 +1,35 @@
 # init_db.py
-from database import Base, engine
-from models.user import User
-from models.lecture import Lecture
-from models.attendance import Attendance
-from models.user_lecture_map import user_lecture
-
-Base.metadata.create_all(bind=engine)
-print("모든 테이블 생성 완료!")
\ No newline at end of file
+# 테이블 생성/변경은 Alembic 마이그레이션으로 관리 (`alembic upgrade head`와 같음)
+import os
+
+from alembic import command
+from alembic.autogenerate import compare_metadata
+from alembic.config import Config
+from alembic.runtime.migration import MigrationContext
+from sqlalchemy import inspect
+
+import models  # noqa: F401  (모든 모델을 metadata에 등록)
+from database import engine
+from models.base import Base
+
+# create_all로 만들던 시절의 스키마에 해당하는 첫 리비전
+INITIAL_REVISION = "26a40c5059b0"
+
+config = Config(os.path.join(os.path.dirname(os.path.abspath(__file__)), "alembic.ini"))
+
+
+def schema_matches_models():
+    """DB 스키마가 현재 모델(= head)과 같으면 True. create_all로 최신 모델을 그대로 만든 DB인 경우."""
+    with engine.connect() as conn:
+        return not compare_metadata(MigrationContext.configure(conn), Base.metadata)
+
+
+inspector = inspect(engine)
+if inspector.has_table("users") and not inspector.has_table("alembic_version"):
+    # 예전에 create_all로 만든 DB: 이미 최신이면 head로, 아니면 첫 리비전으로 표시하고 이후 변경만 적용
+    revision = "head" if schema_matches_models() else INITIAL_REVISION
+    command.stamp(config, revision)
+    print(f"기존 테이블을 리비전 {revision}(으)로 표시")
+
+command.upgrade(config, "head")
+print("모든 테이블 생성 완료!")
@@ -1,6 +1,6 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from routers import auth, attendance, account, lectures, admin, assignment
+from routers import auth, attendance, account, lectures, admin, assignment, locations
 import subprocess
  
 import os
@@ -8,6 +8,11 @@ from contextlib import asynccontextmanager
 from sqlalchemy.orm import Session
 from database import SessionLocal
 from models.user import User
+from utils.browser_pool import browser_pool
+from utils.plato_http import plato_http
+from utils.location_search import location_index
+from services.onestop_catalog import catalog_client
+from services.lecture_sync import lecture_sync_jobs
 import sys
 import psutil
 
@@ -22,8 +27,17 @@ async def lifespan(app: FastAPI):
     db: Session = SessionLocal()
     try:
         users = db.query(User).all()
+        # PLATO/onestop 스크래핑에 쓰는 공유 Chromium 풀
+        await browser_pool.start()
+        # 건물/강의실 자동완성 색인 (첫 검색 요청이 색인을 만들지 않도록 미리)
+        await location_index.start()
         yield
     finally:
+        await location_index.stop()
+        await lecture_sync_jobs.shutdown()
+        await catalog_client.close()
+        await browser_pool.stop()
+        await plato_http.aclose()
         db.close()
 
 app = FastAPI(lifespan=lifespan)
@@ -44,9 +58,5 @@ app.include_router(attendance.router)#, prefix="/api/attendance", tags=["Attenda
 app.include_router(lectures.router)#, prefix="/api/lectures", tags=["Lectures"])
 app.include_router(admin.router)#, prefix="/api/admin", tags=["Admin"])
 app.include_router(assignment.router)#, prefix="/api/assignment", tags=["Assignment"])
+app.include_router(locations.router)
 
-
-from models import Base
-from database import engine
-
-Base.metadata.create_all(bind=engine)
\ No newline at end of file
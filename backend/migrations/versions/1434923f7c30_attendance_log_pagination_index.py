@@ -0,0 +1,26 @@
+"""attendance_log (user_id, timestamp) index for paginated logs
+
+/api/attendance/logs, /api/admin/users/{id}/attendances가 user_id별로
+(timestamp, id) 역순 keyset 페이지네이션을 하므로 정렬까지 인덱스로 처리.
+(InnoDB 보조 인덱스에는 PK(id)가 붙으므로 (user_id, timestamp)로 충분)
+
+Revision ID: 1434923f7c30
+Revises: 71ff60e7a909
+Create Date: 2026-10-18 10:00:00
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = '1434923f7c30'
+down_revision = '71ff60e7a909'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index('ix_attendance_user_time', 'attendance_log', ['user_id', 'timestamp'])
+
+
+def downgrade():
+    op.drop_index('ix_attendance_user_time', table_name='attendance_log')
@@ -0,0 +1,111 @@
+"""initial schema
+
+init_db.py(create_all)로 만들던 기존 테이블. 이미 create_all로 만든 DB는
+`alembic stamp 26a40c5059b0` 후 `alembic upgrade head` (init_db.py가 자동으로 처리).
+
+Revision ID: 26a40c5059b0
+Revises:
+Create Date: 2026-10-18 09:00:00
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = '26a40c5059b0'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        'users',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('name', sa.String(length=64), nullable=False),
+        sa.Column('student_id', sa.String(length=20), nullable=True),
+        sa.Column('student_password_encrypted', sa.Text(), nullable=True),
+        sa.Column('firebase_uid', sa.String(length=128), nullable=True),
+        sa.Column('is_pro', sa.Boolean(), nullable=True),
+        sa.Column('is_admin', sa.Boolean(), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('firebase_uid'),
+    )
+    op.create_table(
+        'pro_keys',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('key', sa.String(length=32), nullable=False),
+        sa.Column('is_used', sa.Boolean(), nullable=True),
+        sa.Column('used_by', sa.Integer(), nullable=True),
+        sa.Column('used_at', sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(['used_by'], ['users.id'], ondelete='SET NULL'),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('key'),
+    )
+    op.create_table(
+        'lectures',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('name', sa.String(length=120), nullable=False),
+        sa.Column('code', sa.String(length=20), nullable=False),
+        sa.Column('section', sa.String(length=10), nullable=False),
+        sa.Column('full_name', sa.String(length=150), nullable=False),
+        sa.Column('plato_course_id', sa.Integer(), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index('ix_lectures_id', 'lectures', ['id'])
+    op.create_table(
+        'lecture_location',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('building_code', sa.String(length=10), nullable=True),
+        sa.Column('room_number', sa.String(length=10), nullable=True),
+        sa.Column('building_name', sa.String(length=100), nullable=True),
+        sa.Column('full_label', sa.String(length=150), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('building_code', 'room_number', name='unique_location'),
+    )
+    op.create_table(
+        'lecture_schedule',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('lecture_id', sa.Integer(), nullable=False),
+        sa.Column('weekday', sa.Integer(), nullable=False),
+        sa.Column('start_time', sa.Time(), nullable=False),
+        sa.Column('end_time', sa.Time(), nullable=False),
+        sa.Column('duration', sa.Integer(), nullable=False),
+        sa.Column('location', sa.String(length=100), nullable=True),
+        sa.Column('lecture_location_id', sa.Integer(), nullable=True),
+        sa.ForeignKeyConstraint(['lecture_id'], ['lectures.id']),
+        sa.ForeignKeyConstraint(['lecture_location_id'], ['lecture_location.id']),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_table(
+        'user_lecture',
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('lecture_id', sa.Integer(), nullable=False),
+        sa.Column('auto_attendance_enabled', sa.Boolean(), server_default=sa.text('0'), nullable=True),
+        sa.Column('attendance_in_progress', sa.Boolean(), server_default=sa.text('0'), nullable=False),
+        sa.ForeignKeyConstraint(['lecture_id'], ['lectures.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('user_id', 'lecture_id'),
+    )
+    op.create_table(
+        'attendance_log',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('lecture_id', sa.Integer(), nullable=False),
+        sa.Column('timestamp', sa.DateTime(), nullable=False),
+        sa.Column('type', sa.Integer(), nullable=False),
+        sa.Column('auth_code', sa.Integer(), nullable=True),
+        sa.ForeignKeyConstraint(['lecture_id'], ['lectures.id']),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+    )
+
+
+def downgrade():
+    op.drop_table('attendance_log')
+    op.drop_table('user_lecture')
+    op.drop_table('lecture_schedule')
+    op.drop_table('lecture_location')
+    op.drop_index('ix_lectures_id', table_name='lectures')
+    op.drop_table('lectures')
+    op.drop_table('pro_keys')
+    op.drop_table('users')
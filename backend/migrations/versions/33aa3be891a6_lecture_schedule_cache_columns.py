@@ -0,0 +1,40 @@
+"""lecture schedule cache columns
+
+- lectures.schedule_semester / schedule_synced_at: 과목·분반별 시간표 캐시
+
+이전 bc3a6f9d08f3에서 이미 추가된 DB도 있으므로 없는 컬럼만 추가한다.
+
+Revision ID: 33aa3be891a6
+Revises: bc3a6f9d08f3
+Create Date: 2026-10-18 09:12:00
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = '33aa3be891a6'
+down_revision = 'bc3a6f9d08f3'
+branch_labels = None
+depends_on = None
+
+
+def _columns(table):
+    """--sql(오프라인)로 SQL만 뽑을 때는 빈 테이블로 가정."""
+    if op.get_context().as_sql:
+        return set()
+    return {column['name'] for column in sa.inspect(op.get_bind()).get_columns(table)}
+
+
+def upgrade():
+    columns = _columns('lectures')
+    with op.batch_alter_table('lectures') as batch_op:
+        if 'schedule_semester' not in columns:
+            batch_op.add_column(sa.Column('schedule_semester', sa.String(length=10), nullable=True))
+        if 'schedule_synced_at' not in columns:
+            batch_op.add_column(sa.Column('schedule_synced_at', sa.DateTime(), nullable=True))
+
+
+def downgrade():
+    with op.batch_alter_table('lectures') as batch_op:
+        batch_op.drop_column('schedule_synced_at')
+        batch_op.drop_column('schedule_semester')
@@ -0,0 +1,62 @@
+"""indexes and unique (code, section) for hot lookups
+
+- attendance_log (user_id, lecture_id, timestamp): already_attended_today
+- lectures (code, section) UNIQUE: 동기화 upsert / IN 조회
+- lectures.plato_course_id: 출석 요약·출석 처리에서 PLATO 강의 ID로 조회
+- user_lecture (auto_attendance_enabled, user_id): 자동 출석 runner
+- lecture_schedule (weekday, lecture_id): /api/lectures/all 요일 필터
+
+Revision ID: 71ff60e7a909
+Revises: 9d6e9b89c4bb
+Create Date: 2026-10-18 09:20:00
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = '71ff60e7a909'
+down_revision = '9d6e9b89c4bb'
+branch_labels = None
+depends_on = None
+
+
+def _check_duplicate_lectures():
+    """같은 (code, section) 강의가 여러 행이면 유니크 제약을 걸 수 없으므로 목록을 보여주고 중단."""
+    if op.get_context().as_sql:
+        return
+    duplicates = op.get_bind().execute(sa.text(
+        "SELECT code, section, COUNT(*) FROM lectures GROUP BY code, section HAVING COUNT(*) > 1"
+    )).all()
+    if duplicates:
+        listed = ", ".join(f"{code}-{section}({count}개)" for code, section, count in duplicates[:20])
+        raise RuntimeError(
+            f"lectures에 (code, section)이 중복된 행이 {len(duplicates)}건 있습니다: {listed}. "
+            "수강/출석/시간표를 한 행으로 옮기고 나머지를 지운 뒤 다시 실행하세요."
+        )
+
+
+def upgrade():
+    _check_duplicate_lectures()
+
+    with op.batch_alter_table('lectures') as batch_op:
+        batch_op.create_unique_constraint('unique_lecture', ['code', 'section'])
+        batch_op.create_index('ix_lectures_plato_course_id', ['plato_course_id'])
+
+    op.create_index(
+        'ix_attendance_user_lecture_time', 'attendance_log', ['user_id', 'lecture_id', 'timestamp']
+    )
+    op.create_index(
+        'ix_user_lecture_auto_attendance', 'user_lecture', ['auto_attendance_enabled', 'user_id']
+    )
+    op.create_index(
+        'ix_lecture_schedule_weekday_lecture', 'lecture_schedule', ['weekday', 'lecture_id']
+    )
+
+
+def downgrade():
+    op.drop_index('ix_lecture_schedule_weekday_lecture', table_name='lecture_schedule')
+    op.drop_index('ix_user_lecture_auto_attendance', table_name='user_lecture')
+    op.drop_index('ix_attendance_user_lecture_time', table_name='attendance_log')
+    with op.batch_alter_table('lectures') as batch_op:
+        batch_op.drop_index('ix_lectures_plato_course_id')
+        batch_op.drop_constraint('unique_lecture', type_='unique')
@@ -0,0 +1,36 @@
+"""users.lecture_list_hash
+
+- users.lecture_list_hash: 대시보드 강의 목록이 바뀌지 않았으면 동기화 생략
+
+이전 bc3a6f9d08f3에서 이미 추가된 DB도 있으므로 없을 때만 추가한다.
+
+Revision ID: 9d6e9b89c4bb
+Revises: 33aa3be891a6
+Create Date: 2026-10-18 09:14:00
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = '9d6e9b89c4bb'
+down_revision = '33aa3be891a6'
+branch_labels = None
+depends_on = None
+
+
+def _columns(table):
+    """--sql(오프라인)로 SQL만 뽑을 때는 빈 테이블로 가정."""
+    if op.get_context().as_sql:
+        return set()
+    return {column['name'] for column in sa.inspect(op.get_bind()).get_columns(table)}
+
+
+def upgrade():
+    if 'lecture_list_hash' not in _columns('users'):
+        with op.batch_alter_table('users') as batch_op:
+            batch_op.add_column(sa.Column('lecture_list_hash', sa.String(length=64), nullable=True))
+
+
+def downgrade():
+    with op.batch_alter_table('users') as batch_op:
+        batch_op.drop_column('lecture_list_hash')
@@ -0,0 +1,42 @@
+"""plato_sessions table
+
+- plato_sessions: 암호화된 PLATO storage_state (cookie_store)
+
+init_db.py(create_all)로 plato_sessions가 이미 만들어진 DB도 있으므로 없을 때만 만든다.
+강의 동기화 컬럼은 이후 리비전(33aa3be891a6, 9d6e9b89c4bb)에서 각각 추가한다.
+
+Revision ID: bc3a6f9d08f3
+Revises: 26a40c5059b0
+Create Date: 2026-10-18 09:10:00
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import mysql
+
+
+revision = 'bc3a6f9d08f3'
+down_revision = '26a40c5059b0'
+branch_labels = None
+depends_on = None
+
+
+def _has_table(name):
+    """--sql(오프라인)로 SQL만 뽑을 때는 빈 DB로 가정."""
+    if op.get_context().as_sql:
+        return False
+    return sa.inspect(op.get_bind()).has_table(name)
+
+
+def upgrade():
+    if not _has_table('plato_sessions'):
+        op.create_table(
+            'plato_sessions',
+            sa.Column('student_id', sa.String(length=20), nullable=False),
+            sa.Column('storage_state_encrypted', sa.Text().with_variant(mysql.MEDIUMTEXT(), 'mysql'), nullable=False),
+            sa.Column('updated_at', sa.DateTime(), nullable=False),
+            sa.PrimaryKeyConstraint('student_id'),
+        )
+
+
+def downgrade():
+    op.drop_table('plato_sessions')
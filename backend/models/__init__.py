@@ -5,6 +5,7 @@ from .attendance import Attendance
 from .user_lecture_map import user_lecture
 from .lecture_schedule import LectureSchedule
 from .lecture_location import LectureLocation
+from .plato_session import PlatoSession
 
 __all__ = [
     "Base",
@@ -14,5 +15,6 @@ __all__ = [
     "Attendance",
     "LectureSchedule",
     "user_lecture",
-    "LectureLocation"
+    "LectureLocation",
+    "PlatoSession"
 ]
\ No newline at end of file
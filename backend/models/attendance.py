@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, ForeignKey, DateTime
+from sqlalchemy import Column, Integer, ForeignKey, DateTime, Index
 from datetime import datetime, timezone
 from models.base import Base  # <- declarative_base()로 생성된 Base 클래스
 
@@ -28,6 +28,13 @@ class Attendance(Base):
     #     UniqueConstraint('user_id', 'lecture_id', name='uix_user_lecture_once'),
     # )
 
+    __table_args__ = (
+        # 오늘 이미 출석했는지 확인 (user_id, lecture_id, timestamp 범위)
+        Index('ix_attendance_user_lecture_time', 'user_id', 'lecture_id', 'timestamp'),
+        # 출석 기록 페이지네이션 (user_id별 timestamp, id 역순)
+        Index('ix_attendance_user_time', 'user_id', 'timestamp'),
+    )
+
     def __repr__(self):
         return (
             f"<Attendance user={self.user_id} lecture={self.lecture_id} "
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, ForeignKey
+from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, UniqueConstraint
 from sqlalchemy.orm import relationship
 from models.base import Base
 
@@ -11,7 +11,11 @@ class Lecture(Base):
     code = Column(String(20), nullable=False)            # 강의 코드
     section = Column(String(10), nullable=False)         # 분반
     full_name = Column(String(150), nullable=False)      # 전체 강의명
-    plato_course_id = Column(Integer, nullable=True)     # PLATO 시스템의 강의 ID
+    plato_course_id = Column(Integer, nullable=True, index=True)  # PLATO 시스템의 강의 ID
+    schedule_semester = Column(String(10), nullable=True)   # 시간표를 마지막으로 가져온 학기 (예: "2025-1")
+    schedule_synced_at = Column(DateTime, nullable=True)    # 시간표를 마지막으로 가져온 시각(UTC), None이면 캐시 무효
 
     schedules = relationship('LectureSchedule', backref='lecture', cascade="all, delete-orphan")  # 강의 시간표(1:N)
-    attendances = relationship('Attendance', backref='lecture')  # 출석 기록(1:N)
\ No newline at end of file
+    attendances = relationship('Attendance', backref='lecture')  # 출석 기록(1:N)
+
+    __table_args__ = (UniqueConstraint('code', 'section', name='unique_lecture'),)
\ No newline at end of file
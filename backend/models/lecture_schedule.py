@@ -1,5 +1,5 @@
 from models.base import Base
-from sqlalchemy import Column, Integer, ForeignKey, Time, String
+from sqlalchemy import Column, Integer, ForeignKey, Time, String, Index
 from sqlalchemy.orm import relationship
 
 class LectureSchedule(Base):
@@ -13,4 +13,7 @@ class LectureSchedule(Base):
     duration = Column(Integer, nullable=False) # 강의 시간(분 단위)
     location = Column(String(100), nullable=True)  # 강의실(텍스트)
     lecture_location_id = Column(Integer, ForeignKey('lecture_location.id'), nullable=True)  # 강의실 ID (외래키)
-    location_details = relationship('LectureLocation', backref='schedules')  # 강의실 상세정보(관계)
\ No newline at end of file
+    location_details = relationship('LectureLocation', backref='schedules')  # 강의실 상세정보(관계)
+
+    # /api/lectures/all의 요일 필터
+    __table_args__ = (Index('ix_lecture_schedule_weekday_lecture', 'weekday', 'lecture_id'),)
\ No newline at end of file
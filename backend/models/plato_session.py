@@ -0,0 +1,22 @@
+from datetime import datetime, timezone
+
+from sqlalchemy import Column, String, Text, DateTime
+from sqlalchemy.dialects.mysql import MEDIUMTEXT
+from models.base import Base
+
+# PLATO 로그인 세션(Playwright storage_state) 저장 테이블
+class PlatoSession(Base):
+    __tablename__ = "plato_sessions"
+
+    student_id = Column(String(20), primary_key=True)  # 학번
+    # Fernet으로 암호화된 storage_state JSON
+    storage_state_encrypted = Column(Text().with_variant(MEDIUMTEXT(), "mysql"), nullable=False)
+    updated_at = Column(
+        DateTime,
+        default=lambda: datetime.now(timezone.utc),
+        onupdate=lambda: datetime.now(timezone.utc),
+        nullable=False
+    )
+
+    def __repr__(self):
+        return f"<PlatoSession {self.student_id} updated_at={self.updated_at}>"
@@ -16,6 +16,7 @@ class User(Base):
     firebase_uid = Column(String(128), unique=True, nullable=True)  # Firebase UID
     is_pro = Column(Boolean, default=False)  # Pro 사용자 여부
     is_admin = Column(Boolean, default=False)  # 관리자 여부
+    lecture_list_hash = Column(String(64), nullable=True)  # 마지막 강의 동기화 때 대시보드 강의 목록 해시
 
     lectures = relationship("Lecture", secondary=user_lecture, backref="users")  # 수강 강의(다대다)
     attendances = relationship(
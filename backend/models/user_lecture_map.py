@@ -1,5 +1,5 @@
 # models/user_lecture_map.py 예시
-from sqlalchemy import Table, Column, Integer, ForeignKey, Boolean, text
+from sqlalchemy import Table, Column, Integer, ForeignKey, Boolean, Index, text
 from models.base import Base
 
 user_lecture = Table(
@@ -10,4 +10,6 @@ user_lecture = Table(
     Column('auto_attendance_enabled', Boolean, default=False, server_default=text("0")),
     # 새로 추가
     Column('attendance_in_progress', Boolean, default=False, nullable=False, server_default=text("0")),
+    # 자동 출석 runner가 auto_attendance_enabled=True인 행을 전부 훑음
+    Index('ix_user_lecture_auto_attendance', 'auto_attendance_enabled', 'user_id'),
 )
\ No newline at end of file
@@ -1,2 +1,2 @@
 # routers/__init__.py
-from . import assignment, auth, attendance, account, lectures, admin
\ No newline at end of file
+from . import assignment, auth, attendance, account, lectures, admin, locations
\ No newline at end of file
@@ -1,14 +1,21 @@
-from fastapi import APIRouter, Depends, HTTPException, Request, Body
+from fastapi import APIRouter, Depends, HTTPException, Request, Body, Query
 from sqlalchemy.orm import Session
 from database import get_db
 from models.user import ProKey, User
-from datetime import datetime
+from datetime import date, datetime
+from typing import Optional
 from services.auth_dependency import get_current_user
 import os
 import psutil
 from utils.auth_helper import decrypt
 from models.lecture import Lecture
 from sqlalchemy import update, and_
+from utils.browser_pool import browser_pool
+from utils.lean_page import lean_page_profile
+from utils.page_ready import navigation_timings
+from services.lecture_service import invalidate_schedule_cache, load_user_lectures
+from services.attendance_log_service import MAX_PAGE_SIZE, list_attendance_logs
+from services.location_service import resolve_schedule_locations
 
 # 관리자 전용 API 라우터
 router = APIRouter(prefix="/api/admin", tags=["admin"])
@@ -19,6 +26,16 @@ def admin_required(current_user: User = Depends(get_current_user)):
         raise HTTPException(status_code=403, detail="관리자 권한이 필요합니다.")
     return current_user
 
+# 브라우저 풀 / 리소스 차단 / 페이지 대기 시간 통계 조회
+@router.get("/browser_stats")
+async def get_browser_stats(current_user: User = Depends(admin_required)):
+    return {
+        "status": "success",
+        "pool": browser_pool.stats(),
+        "lean_page": lean_page_profile.stats(),
+        "page_ready": navigation_timings.stats()
+    }
+
 # 프로키 전체 조회
 @router.get("/prokeys")
 async def list_pro_keys(current_user: User = Depends(admin_required), db: Session = Depends(get_db)):
@@ -121,12 +138,7 @@ async def get_user_enrolled_lectures(user_id: int, current_user: User = Depends(
     if not user:
         raise HTTPException(status_code=404, detail="사용자를 찾을 수 없습니다.")
 
-    # user.lectures 관계 또는 별도 쿼리로 수강 강의 조회
-    lectures = getattr(user, "lectures", None)
-    if lectures is None:
-        # 관계가 없다면 직접 쿼리 (예시)
-        from models.lecture import Lecture
-        lectures = db.query(Lecture).join(Lecture.users).filter(User.id == user_id).all()
+    lectures = load_user_lectures(db, user_id)
 
     WEEKDAYS = ["월", "화", "수", "목", "금", "토", "일"]
     result = []
@@ -159,18 +171,7 @@ async def get_user_auto_attendance_targets(user_id: int, current_user: User = De
     """
     관리자가 특정 사용자의 자동 출석 활성화 강의 목록을 조회
     """
-    from models.lecture import Lecture
-    from models.user_lecture_map import user_lecture
-    lecture_ids = [
-        row.lecture_id
-        for row in db.execute(
-            user_lecture.select().where(
-                (user_lecture.c.user_id == user_id) &
-                (user_lecture.c.auto_attendance_enabled == True)
-            )
-        )
-    ]
-    lectures = db.query(Lecture).filter(Lecture.id.in_(lecture_ids)).all()
+    lectures = load_user_lectures(db, user_id, auto_attendance_only=True)
     WEEKDAYS = ["월", "화", "수", "목", "금", "토", "일"]
     result = []
     for lec in lectures:
@@ -245,18 +246,7 @@ async def get_user_runner_status(user_id: int, current_user: User = Depends(admi
     """
     특정 사용자의 자동 출석 강의 목록 및 runner 상태 반환 (중앙 runner 구조에서는 runner_pid는 None)
     """
-    from models.lecture import Lecture
-    from models.user_lecture_map import user_lecture
-    lecture_ids = [
-        row.lecture_id
-        for row in db.execute(
-            user_lecture.select().where(
-                (user_lecture.c.user_id == user_id) &
-                (user_lecture.c.auto_attendance_enabled == True)
-            )
-        )
-    ]
-    lectures = db.query(Lecture).filter(Lecture.id.in_(lecture_ids)).all()
+    lectures = load_user_lectures(db, user_id, auto_attendance_only=True)
     WEEKDAYS = ["월", "화", "수", "목", "금", "토", "일"]
     result = []
     for lec in lectures:
@@ -367,48 +357,57 @@ async def get_lecture_by_id(
         }
     }
 
+# 강의 시간표 캐시 무효화 (다음 동기화 때 onestop에서 다시 가져옴)
+@router.post("/lectures/schedule_cache/invalidate")
+async def invalidate_lecture_schedule_cache(
+    request: Request,
+    current_user: User = Depends(admin_required),
+    db: Session = Depends(get_db)
+):
+    """
+    body: { "lecture_ids": [1,2,3] } (생략 시 전체 강의)
+    """
+    data = await request.json() if await request.body() else {}
+    lecture_ids = data.get("lecture_ids")
+    if lecture_ids is not None and not isinstance(lecture_ids, list):
+        return {"status": "error", "message": "lecture_ids는 리스트여야 합니다."}
+
+    count = invalidate_schedule_cache(db, lecture_ids)
+    return {"status": "success", "message": f"{count}개 강의의 시간표 캐시가 무효화되었습니다."}
+
+# 전체 시간표의 강의실 위치 연결 (파서 변경 후 재처리용)
+@router.post("/lectures/locations/backfill")
+def backfill_lecture_locations(
+    current_user: User = Depends(admin_required),
+    db: Session = Depends(get_db)
+):
+    stats = resolve_schedule_locations(db)
+    return {"status": "success", **stats}
+
 # 특정 사용자의 모든 출석기록 반환 (최신순)
 @router.get("/users/{user_id}/attendances")
 async def get_user_attendances(
     user_id: int,
+    cursor: Optional[str] = None,
+    lecture_id: Optional[int] = None,
+    date_from: Optional[date] = None,
+    date_to: Optional[date] = None,
+    limit: int = Query(50, ge=1, le=MAX_PAGE_SIZE),
     current_user: User = Depends(admin_required),
     db: Session = Depends(get_db)
 ):
     """
-    특정 사용자의 모든 출석기록 반환 (최신순)
+    특정 사용자의 출석기록 반환 (최신순, 페이지 단위. 다음 페이지는 next_cursor로 요청)
     """
-    from models.attendance import Attendance
-    from models.lecture import Lecture
-
     user = db.query(User).filter_by(id=user_id).first()
     if not user:
         raise HTTPException(status_code=404, detail="사용자를 찾을 수 없습니다.")
 
-    attendances = (
-        db.query(Attendance)
-        .filter(Attendance.user_id == user_id)
-        .order_by(Attendance.timestamp.desc())
-        .all()
-    )
-
-    # 강의 id → 강의명 매핑을 위해 미리 조회
-    lecture_ids = {a.lecture_id for a in attendances}
-    lectures = {l.id: l for l in db.query(Lecture).filter(Lecture.id.in_(lecture_ids)).all()}
-
-    result = []
-    for a in attendances:
-        lec = lectures.get(a.lecture_id)
-        result.append({
-            "attendance_id": a.id,  # 출석 고유 ID
-            "lecture_id": a.lecture_id,  # 강의 ID
-            "lecture_name": lec.name if lec else None,  # 강의명
-            "timestamp": a.timestamp.isoformat(),  # 출석 시각
-            "type": a.type,  # 출석 타입
-            "auth_code": a.auth_code  # 인증 코드
-        })
-
-    return {
-        "status": "success",
-        "count": len(result),
-        "attendances": result
-    }
\ No newline at end of file
+    try:
+        page = list_attendance_logs(
+            db, user_id, limit=limit, cursor=cursor,
+            lecture_id=lecture_id, date_from=date_from, date_to=date_to
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return {"status": "success", **page}
\ No newline at end of file
@@ -1,17 +1,19 @@
-from fastapi import APIRouter, Request, Depends, HTTPException, File, UploadFile, Form
+from fastapi import APIRouter, Request, Depends, HTTPException, File, UploadFile, Form, Query
 from sqlalchemy.orm import Session
 from database import get_db
 from utils.plato_login import get_plato_session
+from utils.page_ready import wait_ready, PLATO_ATTENDANCE, PLATO_ATTENDANCE_SUBMIT
 from utils.schedule_checker import is_currently_in_lecture
-from services.lecture_service import find_current_lecture, show_user_lectures
+from services.lecture_service import find_current_lecture, load_user_lectures, show_user_lectures
 from services.auth_dependency import get_current_user, verify_pro_user
 from services.attendance_service import get_attendance_summary_for_user
+from services.attendance_log_service import MAX_PAGE_SIZE, list_attendance_logs
 import logging
-from playwright.async_api import async_playwright
 from models.attendance import Attendance
 from models.lecture import Lecture
 import requests
-from bs4 import BeautifulSoup
+from bs4 import SoupStrainer
+from utils.html_parser import make_soup
 import random
 import os
 from utils.auth_helper import decrypt
@@ -20,7 +22,8 @@ from fastapi.responses import FileResponse
 from sqlalchemy import update, and_
 from models.user_lecture_map import user_lecture
 from sqlalchemy.exc import IntegrityError
-from datetime import datetime, timedelta, timezone
+from datetime import date, datetime, timedelta, timezone
+from typing import Optional
 from utils.attendance_summary import make_attendance_prompt
 from services.ai_service import get_gpt_attendance_analysis
 
@@ -38,11 +41,14 @@ async def extract_requests_session_from_context(context):
         session.cookies.set(cookie['name'], cookie['value'], domain=cookie.get("domain"))
     return session
 
+# autoattendance.php 폼에서 필요한 것은 input 태그뿐
+FORM_INPUTS = SoupStrainer("input")
+
 async def get_form_data(session, course_id):
     """autoattendance.php에서 필요한 form_data를 파싱해 반환한다."""
     url = f"https://plato.pusan.ac.kr/local/ubattendance/autoattendance.php?id={course_id}"
     res = session.get(url)
-    soup = BeautifulSoup(res.text, "html.parser")
+    soup = make_soup(res.text, FORM_INPUTS)
     return {
         "type": soup.find("input", {"name": "type"})["value"],
         "id": soup.find("input", {"name": "id"})["value"],
@@ -105,33 +111,26 @@ async def auto_attend(
         return {"status": "error", "message": "이미 오늘 출석한 강의입니다."}
 
     try:
-        async with async_playwright() as p:
-            browser, page = await get_plato_session(p, user)
-            attendance_url = f"https://plato.pusan.ac.kr/local/ubattendance/my_status.php?id={lecture.plato_course_id}"
-            await page.goto(attendance_url)
-            await page.wait_for_load_state("networkidle")
+        attendance_url = f"https://plato.pusan.ac.kr/local/ubattendance/my_status.php?id={lecture.plato_course_id}"
+        async with get_plato_session(user, attendance_url, PLATO_ATTENDANCE) as page:
 
             # 'autoattendance.php'가 아니라면 현재 출석 중이 아님
             if "autoattendance.php" not in page.url:
-                await browser.close()
                 return {"status": "error", "message": "현재 출석 중이 아닙니다."}
 
             # 수동 인증코드 입력
             await page.fill('input[name="authkey"]', auth_code)
-            await page.click('input[type="submit"]')
-            await page.wait_for_load_state("networkidle")
+            await wait_ready(page, PLATO_ATTENDANCE_SUBMIT, lambda: page.click('input[type="submit"]'))
 
             final_url = page.url
             if "user_action.php" in final_url:
                 # 인증 실패
-                await browser.close()
                 return {"status": "error", "message": "인증코드가 잘못되었거나 출석 실패"}
             elif "my_status.php" in final_url:
                 # 출석 성공 → DB 저장
                 # [수정] 다시 한 번 KST 기준 중복 체크
                 already = already_attended_today(db, user.id, lecture.id)
                 if already:
-                    await browser.close()
                     logging.warning(f"[⚠️ 이미 출석 처리됨(경합)] user_id={user.id}, lecture_id={lecture.id}")
                     return {"status": "error", "message": "이미 출석한 강의입니다."}
                 try:
@@ -144,21 +143,17 @@ async def auto_attend(
                     ))
                     try:
                         db.commit()
-                        await browser.close()
                         logging.info(f"[✅ 출석 성공] user_id={user.id}, lecture_id={lecture.id}")
                         return {"status": "success", "message": "출석 인증 완료!"}
                     except IntegrityError as ie:
                         db.rollback()
-                        await browser.close()
                         logging.warning(f"[❌ 출석 INSERT IntegrityError] user_id={user.id}, lecture_id={lecture.id}, error={str(ie)}")
                         return {"status": "error", "message": "이미 출석한 강의이거나 DB 오류가 발생했습니다."}
                 except Exception as e:
                     db.rollback()
-                    await browser.close()
                     logging.error(f"[❌ 출석 INSERT 실패] user_id={user.id}, lecture_id={lecture.id}, error={str(e)}")
                     return {"status": "error", "message": "이미 출석한 강의이거나 DB 오류가 발생했습니다."}
             else:
-                await browser.close()
                 return {"status": "error", "message": "출석 실패: 알 수 없는 리다이렉트 경로"}
     except Exception as e:
         db.rollback()
@@ -171,36 +166,26 @@ async def auto_attend(
 
 @router.get("/logs")
 async def get_attendance_logs(
-    request: Request,
+    cursor: Optional[str] = None,
+    lecture_id: Optional[int] = None,
+    date_from: Optional[date] = None,
+    date_to: Optional[date] = None,
+    limit: int = Query(50, ge=1, le=MAX_PAGE_SIZE),
     current_user=Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """
-    사용자의 출석 로그(내림차순).
+    사용자의 출석 로그(최신순, 페이지 단위).
+    다음 페이지는 응답의 next_cursor를 cursor로 넘겨 요청. date_from/date_to는 KST 날짜(YYYY-MM-DD).
     """
-    user = current_user
-    logs = db.query(Attendance).filter_by(user_id=user.id).order_by(Attendance.timestamp.desc()).all()
-
-    # 강의 id → 강의명 매핑을 위해 미리 조회
-    lecture_ids = {log.lecture_id for log in logs}
-    lectures = {l.id: l for l in db.query(Lecture).filter(Lecture.id.in_(lecture_ids)).all()}
-
-    result = []
-    for log in logs:
-        lec = lectures.get(log.lecture_id)
-        result.append({
-            "attendance_id": log.id,
-            "lecture_id": log.lecture_id,
-            "lecture_name": lec.name if lec else None,
-            "timestamp": log.timestamp.isoformat(),
-            "type": log.type,
-            "auth_code": log.auth_code
-        })
-    return {
-        "status": "success",
-        "count": len(result),
-        "attendances": result
-    }
+    try:
+        page = list_attendance_logs(
+            db, current_user.id, limit=limit, cursor=cursor,
+            lecture_id=lecture_id, date_from=date_from, date_to=date_to
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return {"status": "success", **page}
 
 @router.get("/status")
 async def check_attendance_status(
@@ -326,99 +311,94 @@ async def bruteforce_attend(
 
     try:
         # ===== (원래 브루트포스 로직) =====
-        async with async_playwright() as p:
-            browser, page = await get_plato_session(p, user)
-            attendance_url = f"https://plato.pusan.ac.kr/local/ubattendance/my_status.php?id={lecture.plato_course_id}"
-            await page.goto(attendance_url)
-            await page.wait_for_load_state("networkidle")
+        attendance_url = f"https://plato.pusan.ac.kr/local/ubattendance/my_status.php?id={lecture.plato_course_id}"
+        async with get_plato_session(user, attendance_url, PLATO_ATTENDANCE) as page:
 
             if "autoattendance.php" not in page.url:
-                await browser.close()
                 return {"status": "error", "message": "현재 출석 중이 아닙니다."}
 
             context = page.context
             session = await extract_requests_session_from_context(context)
-            await browser.close()
 
-            codes = list(range(1000))
-            random.shuffle(codes)
-            headers = {
-                "Referer": f"https://plato.pusan.ac.kr/local/ubattendance/autoattendance.php?id={lecture.plato_course_id}"
-            }
+        codes = list(range(1000))
+        random.shuffle(codes)
+        headers = {
+            "Referer": f"https://plato.pusan.ac.kr/local/ubattendance/autoattendance.php?id={lecture.plato_course_id}"
+        }
 
-            for code in codes:
-                try:
-                    form_data = await get_form_data(session, lecture.plato_course_id)
-                    form_data["authkey"] = f"{code:03d}"
-
-                    res = session.post(
-                        "https://plato.pusan.ac.kr/local/ubattendance/user_action.php",
-                        data=form_data,
-                        headers=headers,
-                        allow_redirects=True
+        for code in codes:
+            try:
+                form_data = await get_form_data(session, lecture.plato_course_id)
+                form_data["authkey"] = f"{code:03d}"
+
+                res = session.post(
+                    "https://plato.pusan.ac.kr/local/ubattendance/user_action.php",
+                    data=form_data,
+                    headers=headers,
+                    allow_redirects=True
+                )
+
+                if "my_status.php" in res.url:
+                    logging.info(f"[인증코드 추측 성공] code={code:03d}")
+
+                    # 다시 한 번 오늘 출석 중복 체크 (경합 방지, KST 기준)
+                    already = already_attended_today(db, user.id, lecture.id)
+                    if already:
+                        logging.warning(
+                            f"[이미 오늘 출석 처리됨(경합)] user_id={user.id}, lecture_id={lecture.id}"
+                        )
+                        return {
+                            "status": "error",
+                            "message": "이미 오늘 출석한 강의입니다 (경합)."
+                        }
+
+                    new_attendance = Attendance(
+                        user_id=user.id,
+                        lecture_id=lecture.id,
+                        type=1,  # 수동 브루트포스
+                        auth_code=code
                     )
+                    db.add(new_attendance)
+
+                    try:
+                        db.commit()
+                        logging.info(
+                            f"[DB INSERT 성공] user_id={user.id}, lecture_id={lecture.id}, code={code:03d}"
+                        )
+                        return {
+                            "status": "success",
+                            "message": f"브루트포스 출석 성공! 코드: {code:03d}"
+                        }
 
-                    if "my_status.php" in res.url:
-                        logging.info(f"[인증코드 추측 성공] code={code:03d}")
-
-                        # 다시 한 번 오늘 출석 중복 체크 (경합 방지, KST 기준)
-                        already = already_attended_today(db, user.id, lecture.id)
-                        if already:
-                            logging.warning(
-                                f"[이미 오늘 출석 처리됨(경합)] user_id={user.id}, lecture_id={lecture.id}"
-                            )
-                            return {
-                                "status": "error",
-                                "message": "이미 오늘 출석한 강의입니다 (경합)."
-                            }
-
-                        new_attendance = Attendance(
-                            user_id=user.id,
-                            lecture_id=lecture.id,
-                            type=1,  # 수동 브루트포스
-                            auth_code=code
+                    except IntegrityError as ie:
+                        db.rollback()
+                        logging.warning(
+                            f"[DB INSERT 충돌] code={code:03d}, error={str(ie)}"
                         )
-                        db.add(new_attendance)
-
-                        try:
-                            db.commit()
-                            logging.info(
-                                f"[DB INSERT 성공] user_id={user.id}, lecture_id={lecture.id}, code={code:03d}"
-                            )
-                            return {
-                                "status": "success",
-                                "message": f"브루트포스 출석 성공! 코드: {code:03d}"
-                            }
-
-                        except IntegrityError as ie:
-                            db.rollback()
-                            logging.warning(
-                                f"[DB INSERT 충돌] code={code:03d}, error={str(ie)}"
-                            )
-                            return {
-                                "status": "error",
-                                "message": f"이미 출석한 강의(중복) - code={code:03d}"
-                            }
-
-                        except Exception as e:
-                            db.rollback()
-                            logging.error(
-                                f"[DB INSERT 에러] code={code:03d}, error={str(e)}"
-                            )
-                            return {
-                                "status": "error",
-                                "message": "DB 삽입 오류가 발생했습니다."
-                            }
+                        return {
+                            "status": "error",
+                            "message": f"이미 출석한 강의(중복) - code={code:03d}"
+                        }
 
-                except Exception as e:
-                    db.rollback()
-                    logging.warning(f"[브루트포스 시도 실패] code={code:03d}, error={str(e)}")
+                    except Exception as e:
+                        db.rollback()
+                        logging.error(
+                            f"[DB INSERT 에러] code={code:03d}, error={str(e)}"
+                        )
+                        return {
+                            "status": "error",
+                            "message": "DB 삽입 오류가 발생했습니다."
+                        }
 
-            # 모든 코드 실패
-            return {
-                "status": "error",
-                "message": "브루트포스 출석 실패: 모든 코드 시도 실패"
-            }
+            except Exception as e:
+                db.rollback()
+                logging.warning(f"[브루트포스 시도 실패] code={code:03d}, error={str(e)}")
+
+        # 모든 코드 실패
+        return {
+            "status": "error",
+            "message": "브루트포스 출석 실패: 모든 코드 시도 실패"
+        }
 
     except Exception as e:
         logging.error(f"[requests 브루트포스 출석 오류] user_id={user.id}, error={str(e)}")
@@ -570,18 +550,7 @@ async def get_auto_attendance_targets(
     """
     현재 로그인한 사용자의 자동 출석 '활성화된' 강의 목록 반환.
     """
-    from models.lecture import Lecture
-
-    lecture_ids = [
-        row.lecture_id
-        for row in db.execute(
-            user_lecture.select().where(
-                (user_lecture.c.user_id == current_user.id) &
-                (user_lecture.c.auto_attendance_enabled == True)
-            )
-        )
-    ]
-    lectures = db.query(Lecture).filter(Lecture.id.in_(lecture_ids)).all()
+    lectures = load_user_lectures(db, current_user.id, auto_attendance_only=True)
 
     WEEKDAYS = ["월", "화", "수", "목", "금", "토", "일"]
     result = []
@@ -666,10 +635,7 @@ async def get_my_lectures(
     """
     현재 로그인한 사용자의 전체 수강 강의 목록(자동 출석 여부 무관).
     """
-    from models.lecture import Lecture
-    lectures = db.query(Lecture).join(user_lecture).filter(
-        user_lecture.c.user_id == current_user.id
-    ).all()
+    lectures = load_user_lectures(db, current_user.id)
 
     WEEKDAYS = ["월", "화", "수", "목", "금", "토", "일"]
     result = []
@@ -1,24 +1,19 @@
+import json
 import logging
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
+from sqlalchemy import func, select
 from sqlalchemy.orm import Session
 from database import get_db
-from models import Lecture, LectureSchedule, LectureLocation, User
+from models import Lecture, LectureSchedule, User
+from models.user_lecture_map import user_lecture
 from services.auth_dependency import get_current_user
-from services.lecture_service import (
-    show_user_lectures,
-    parse_lecture_list,
-    store_parsed_lectures,
-    enroll_user_in_lectures,
-    get_schedule,
-    save_schedule_to_db,
-)
-from utils.location_parser import parse_location
-from utils.plato_login import get_plato_session
-from utils.plato_popup_closer import popup_close
-from urllib.parse import urlparse, parse_qs
+from services.lecture_service import load_user_lectures, show_user_lectures
+from services.lecture_sync import lecture_sync_jobs
+from services.location_service import resolve_schedule_locations
+from utils.serializer import serialize_schedule
 from datetime import datetime
-from playwright.async_api import async_playwright
 from typing import List, Optional
 from pydantic import BaseModel
 
@@ -26,6 +21,10 @@ router = APIRouter(prefix="/api/lectures", tags=["lectures"])
 
 WEEKDAYS = ['월', '화', '수', '목', '금', '토', '일']
 
+# /all 페이지 크기
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 500
+
 # ====== Pydantic 모델 정의 ======
 class LectureLocationOut(BaseModel):
     building_name: Optional[str]
@@ -58,27 +57,72 @@ class MyLecturesResponse(BaseModel):
     my_lectures: List[LectureOut]
 
 @router.get("/all")
-def get_all_lectures(db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
-    lectures = db.query(Lecture).all()
-    data = []
-    for lec in lectures:
-        schedules = [{
-            'weekday': WEEKDAYS[sched.weekday],
-            'start': sched.start_time.strftime("%H:%M"),
-            'end': sched.end_time.strftime("%H:%M")
-        } for sched in lec.schedules]
+def get_all_lectures(
+    code: Optional[str] = None,
+    name: Optional[str] = None,
+    weekday: Optional[int] = Query(None, ge=0, le=6),
+    after_id: Optional[int] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    전체 강의 목록 (id 순 keyset 페이지네이션).
+    - code: 강의 코드 접두어, name: 강의명 부분 일치, weekday: 해당 요일(0=월)에 수업이 있는 강의
+    - after_id: 이전 응답의 next_cursor. 더 없으면 next_cursor는 None
+    쿼리는 페이지 크기만큼만 다룸: 강의 1번, 수강생 수 GROUP BY COUNT 1번, 시간표 1번.
+    """
+    query = select(Lecture.id, Lecture.name, Lecture.code, Lecture.section, Lecture.plato_course_id)
+    if code:
+        query = query.where(Lecture.code.startswith(code, autoescape=True))
+    if name:
+        query = query.where(Lecture.name.contains(name, autoescape=True))
+    if weekday is not None:
+        query = query.where(
+            Lecture.id.in_(select(LectureSchedule.lecture_id).where(LectureSchedule.weekday == weekday))
+        )
+    if after_id is not None:
+        query = query.where(Lecture.id > after_id)
+    rows = db.execute(query.order_by(Lecture.id).limit(limit + 1)).all()
+
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    lecture_ids = [row.id for row in rows]
+
+    student_counts = {}
+    schedules = {lecture_id: [] for lecture_id in lecture_ids}
+    if lecture_ids:
+        student_counts = dict(db.execute(
+            select(user_lecture.c.lecture_id, func.count())
+            .where(user_lecture.c.lecture_id.in_(lecture_ids))
+            .group_by(user_lecture.c.lecture_id)
+        ).all())
+        for sched in db.execute(
+            select(LectureSchedule.lecture_id, LectureSchedule.weekday, LectureSchedule.start_time, LectureSchedule.end_time)
+            .where(LectureSchedule.lecture_id.in_(lecture_ids))
+            .order_by(LectureSchedule.lecture_id, LectureSchedule.weekday, LectureSchedule.start_time)
+        ):
+            schedules[sched.lecture_id].append({
+                'weekday': WEEKDAYS[sched.weekday],
+                'start': sched.start_time.strftime("%H:%M"),
+                'end': sched.end_time.strftime("%H:%M")
+            })
 
-        data.append({
-            'id': lec.id,
-            'name': lec.name,
-            'code': lec.code,
-            'section': lec.section,
-            'student_count': len(lec.users),
-            'plato_course_id': lec.plato_course_id,
-            'schedules': schedules
-        })
+    data = [{
+        'id': row.id,
+        'name': row.name,
+        'code': row.code,
+        'section': row.section,
+        'student_count': student_counts.get(row.id, 0),
+        'plato_course_id': row.plato_course_id,
+        'schedules': schedules[row.id]
+    } for row in rows]
 
-    return {"status": "success", "lectures": data}
+    return {
+        "status": "success",
+        "lectures": data,
+        "next_cursor": lecture_ids[-1] if has_more else None,
+    }
 
 
 @router.get("/my", response_model=MyLecturesResponse)
@@ -119,64 +163,51 @@ def get_my_lectures(current_user: User = Depends(get_current_user)):
 
 
 @router.post("/update")
-async def update_lectures_and_schedule(
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
-):
-    try:
-        async with async_playwright() as p:
-            browser, page = await get_plato_session(p, current_user)
-            context = page.context
-            try:
-                html = await page.content()
-                lectures = parse_lecture_list(html)
-                store_parsed_lectures(lectures, db)
-                current_user.lectures.clear()
-                db.commit()
-                enroll_user_in_lectures(current_user, lectures, db)
-
-                # Example of Firebase user update - after which browser context should be recreated
-                # (Assuming somewhere here user.update_email or update_profile is called)
-                # For demonstration, let's assume after enrollment we update Firebase user email:
-                # await current_user.update_email(new_email)
-                # After that, close and recreate context:
-                # await context.close()
-                # context = await browser.new_context()
-                # page = await context.new_page()
-                # If storage_state is used, save again here:
-                # await context.storage_state(path="auth.json")
-
-                for lec in lectures:
-                    try:
-                        schedule_data = await get_schedule(lec["code"], lec["section"], lec["name"], playwright=p)
-                        save_schedule_to_db(lec["code"], lec["section"], schedule_data, db)
-                        lec["schedule"] = schedule_data
-
-                        await page.goto("https://plato.pusan.ac.kr")
-                        await popup_close(page)
-                        await page.wait_for_load_state("networkidle")
-                        await page.locator('div.course-title', has_text=lec["name"]).click()
-                        await page.wait_for_load_state("networkidle")
-                        url = page.url
-                        query = parse_qs(urlparse(url).query)
-                        plato_id = query.get("id", [None])[0]
-
-                        if plato_id:
-                            db_lecture = db.query(Lecture).filter_by(code=lec["code"], section=lec["section"]).first()
-                            if db_lecture:
-                                db_lecture.plato_course_id = int(plato_id)
-                                lec["plato_course_id"] = int(plato_id)
-                                db.commit()
-
-                        logging.info(f"[강의 처리 성공] {lec['full_name']}")
-                    except Exception as e:
-                        logging.warning(f"[강의 처리 실패] {lec['name']}: {e}")
-                return {"status": "success", "message": "강의 및 시간표 업데이트 완료", "lectures": lectures}
-            finally:
-                await browser.close()
-    except Exception as e:
-        logging.error(f"[강의 업데이트 실패] {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+async def update_lectures_and_schedule(force: bool = False, current_user: User = Depends(get_current_user)):
+    """
+    강의/시간표 동기화를 백그라운드 작업으로 시작하고 바로 반환.
+    force=true면 강의 목록이 지난번과 같아도 건너뛰지 않고 다시 반영한다.
+    진행 상황은 /update/{job_id} (상태) 또는 /update/{job_id}/events (SSE)로 확인.
+    이미 실행 중인 작업이 있으면 새로 만들지 않고 그 작업을 돌려준다.
+    """
+    job, created = lecture_sync_jobs.submit(current_user.id, force=force)
+    logging.info(f"[강의 동기화 요청] user={current_user.id}, job={job.id}, 새 작업={created}")
+    return {
+        "status": "accepted",
+        "message": "강의 및 시간표 업데이트를 시작했습니다." if created else "이미 진행 중인 업데이트가 있습니다.",
+        "job_id": job.id,
+        "deduplicated": not created,
+    }
+
+
+def _get_own_job(job_id, current_user):
+    job = lecture_sync_jobs.get(job_id)
+    if job is None or job.user_id != current_user.id:
+        raise HTTPException(status_code=404, detail="해당 작업을 찾을 수 없습니다.")
+    return job
+
+
+@router.get("/update/{job_id}")
+async def get_update_status(job_id: str, current_user: User = Depends(get_current_user)):
+    return _get_own_job(job_id, current_user).to_dict()
+
+
+@router.get("/update/{job_id}/events")
+async def stream_update_events(job_id: str, current_user: User = Depends(get_current_user)):
+    """동기화 진행 이벤트를 SSE로 전송. 처음 이벤트부터 재생하고, 작업이 끝나면 result를 보내고 종료."""
+    job = _get_own_job(job_id, current_user)
+
+    async def event_stream():
+        async for event in job.follow():
+            yield f"event: progress\ndata: {json.dumps(event, ensure_ascii=False)}\n\n"
+        final = {"status": job.status, "result": job.result, "error": job.error}
+        yield f"event: done\ndata: {json.dumps(final, ensure_ascii=False)}\n\n"
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
 
 
 @router.post("/update_location")
@@ -186,65 +217,26 @@ def api_update_location(
 ):
     logging.info(f"[update_location] 라우트 진입: user={current_user.id}")
     try:
-        lectures = show_user_lectures(current_user)
+        stats = resolve_schedule_locations(db, user_id=current_user.id)
+        logging.info(f"[update_location] 강의실 위치정보 업데이트 완료: {stats}")
+
+        # 커밋 뒤 만료된 객체를 하나씩 다시 읽지 않도록 새로 연결된 강의실까지 한 번에 로드
+        lectures = load_user_lectures(db, current_user.id)
         if not lectures:
             logging.info("[update_location] 등록된 강의 없음")
             return {"status": "empty", "message": "등록된 강의가 없습니다.", "my_lectures": []}
 
-        for lecture in lectures:
-            for schedule in lecture.schedules:
-                location_str = schedule.location
-                if location_str:
-                    parsed = parse_location(location_str)
-                    logging.debug(f"[update_location] location_str={location_str}, parsed={parsed}")
-                    if parsed and parsed.get("type") == "offline":
-                        building_code = parsed.get("building_code")
-                        room = parsed.get("room")
-                        building_name = parsed.get("building_name")
-
-                        loc_obj = db.query(LectureLocation).filter_by(
-                            building_code=building_code,
-                            room_number=room
-                        ).first()
-
-                        if not loc_obj:
-                            loc_obj = LectureLocation(
-                                building_code=building_code,
-                                room_number=room,
-                                building_name=building_name
-                            )
-                            db.add(loc_obj)
-                            db.commit()
-                            logging.info(f"[update_location] 새 location 추가: {building_code} {room} {building_name}")
-
-                        schedule.location_details = loc_obj
-        db.commit()
-        logging.info(f"[update_location] 강의실 위치정보 업데이트 완료")
-
-        enriched_data = []
-        for lecture in lectures:
-            schedules = []
-            for sched in lecture.schedules:
-                schedules.append({
-                    "weekday": WEEKDAYS[sched.weekday],
-                    "start": sched.start_time.strftime("%H:%M"),
-                    "end": sched.end_time.strftime("%H:%M"),
-                    "duration": (datetime.combine(datetime.today(), sched.end_time) - datetime.combine(datetime.today(), sched.start_time)).seconds // 60,
-                    "location": sched.location,
-                    "location_details": {
-                        "building_name": sched.location_details.building_name if sched.location_details else None,
-                        "building_code": sched.location_details.building_code if sched.location_details else None,
-                        "room_number": sched.location_details.room_number if sched.location_details else None
-                    } if sched.location_details else None
-                })
-            enriched_data.append({
+        enriched_data = [
+            {
                 "id": lecture.id,
                 "name": lecture.name,
                 "code": lecture.code,
                 "section": lecture.section,
                 "plato_course_id": lecture.plato_course_id,
-                "schedules": schedules
-            })
+                "schedules": [serialize_schedule(sched) for sched in lecture.schedules]
+            }
+            for lecture in lectures
+        ]
 
         logging.info(f"[update_location] 반환 데이터 my_lectures 개수: {len(enriched_data)}")
         return {"status": "success", "message": "강의실 위치가 업데이트되었습니다.", "my_lectures": enriched_data}
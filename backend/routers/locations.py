@@ -0,0 +1,105 @@
+import time
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, Request, Response
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+from sqlalchemy import tuple_
+from sqlalchemy.orm import Session
+
+from database import get_db
+from models import LectureLocation, LectureSchedule, User
+from services.auth_dependency import get_current_user
+from utils.location_parser import BUILDING_REGISTRY, REGISTRY_VERSION, parse_locations
+from utils.location_search import location_index
+
+router = APIRouter(prefix="/api/locations", tags=["locations"])
+
+# 한 번에 해석할 수 있는 최대 개수
+MAX_RESOLVE_ITEMS = 500
+
+
+class ResolveRequest(BaseModel):
+    locations: List[str] = []
+    schedule_ids: List[int] = []
+
+
+@router.get("/buildings")
+def get_building_registry(request: Request, v: Optional[str] = None):
+    """
+    전체 건물 목록(캠퍼스별 코드 → 이름)을 버전과 함께 반환.
+    ?v=<version>으로 요청하면 내용이 바뀌지 않으므로 1년 캐시(immutable),
+    버전 없이 요청하면 ETag로 재검증하도록 짧게 캐시한다.
+    """
+    etag = f'"{REGISTRY_VERSION}"'
+    if v == REGISTRY_VERSION:
+        cache_control = "public, max-age=31536000, immutable"
+    else:
+        cache_control = "public, max-age=3600"
+    headers = {"ETag": etag, "Cache-Control": cache_control}
+
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return JSONResponse(dict(BUILDING_REGISTRY), headers=headers)
+
+
+@router.get("/search")
+def search_locations(q: str = "", limit: int = 8, current_user: User = Depends(get_current_user)):
+    """
+    건물명/건물 코드/강의실 자동완성. 메모리 색인만 조회하므로 키 입력마다 호출해도 됨.
+    초성 검색 지원 (예: "ㅅㅎㄱ" → 수학관·공동연구소동).
+    """
+    start = time.perf_counter()
+    results = location_index.search(q, limit=max(1, min(limit, 20)))
+    return {
+        "status": "success",
+        "results": results,
+        "took_ms": round((time.perf_counter() - start) * 1000, 3),
+    }
+
+
+@router.post("/resolve")
+def resolve_locations(
+    body: ResolveRequest,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """
+    위치 문자열 또는 시간표 id 여러 개를 한 번에 건물/호실 정보로 해석 (DB는 읽기만 함).
+    - locations: {원문: 파싱 결과 + 저장된 lecture_location_id}
+    - schedules: {시간표 id: 같은 형식}
+    """
+    if len(body.locations) + len(body.schedule_ids) > MAX_RESOLVE_ITEMS:
+        return {"status": "error", "message": f"한 번에 최대 {MAX_RESOLVE_ITEMS}개까지 조회할 수 있습니다."}
+
+    schedule_texts = {}
+    if body.schedule_ids:
+        rows = db.query(LectureSchedule.id, LectureSchedule.location).filter(
+            LectureSchedule.id.in_(set(body.schedule_ids))
+        )
+        schedule_texts = {schedule_id: location for schedule_id, location in rows}
+
+    parsed = parse_locations(body.locations + [t for t in schedule_texts.values() if t])
+
+    # 저장된 강의실 id를 한 번의 IN 조회로 붙임
+    keys = {
+        (p["building_code"], p["room"]) for p in parsed.values() if p["type"] == "offline"
+    }
+    location_ids = {}
+    if keys:
+        rows = db.query(LectureLocation.id, LectureLocation.building_code, LectureLocation.room_number).filter(
+            tuple_(LectureLocation.building_code, LectureLocation.room_number).in_(keys)
+        )
+        location_ids = {(code, room): location_id for location_id, code, room in rows}
+    for p in parsed.values():
+        p["lecture_location_id"] = location_ids.get((p["building_code"], p["room"]))
+
+    return {
+        "status": "success",
+        "registry_version": REGISTRY_VERSION,
+        "locations": {text: parsed[text] for text in body.locations},
+        "schedules": {
+            schedule_id: parsed[text] if text else None
+            for schedule_id, text in schedule_texts.items()
+        },
+    }
@@ -18,8 +18,9 @@ import requests
 import random
 import logging
 import datetime
-from runners.plato_cookie import load_cookies_if_exist, save_cookies
-from bs4 import BeautifulSoup
+from utils.plato_cookie import load_cookies_if_exist, save_cookies
+from bs4 import SoupStrainer
+from utils.html_parser import make_soup
 from sqlalchemy.exc import IntegrityError
 
 SessionLocal = sessionmaker(bind=engine)
@@ -51,10 +52,13 @@ async def extract_requests_session_from_context(context):
         session.cookies.set(cookie["name"], cookie["value"], domain=cookie.get("domain"))
     return session
 
+# autoattendance.php 폼에서 필요한 것은 input 태그뿐
+FORM_INPUTS = SoupStrainer("input")
+
 async def get_form_data(session, course_id):
     url = f"https://plato.pusan.ac.kr/local/ubattendance/autoattendance.php?id={course_id}"
     res = session.get(url)
-    soup = BeautifulSoup(res.text, "html.parser")
+    soup = make_soup(res.text, FORM_INPUTS)
     return {
         "type": soup.find("input", {"name": "type"})["value"],
         "id": soup.find("input", {"name": "id"})["value"],
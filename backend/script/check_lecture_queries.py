@@ -0,0 +1,93 @@
+"""
+load_user_lectures가 수강 강의 수와 상관없이 같은 수의 쿼리로 강의 → 시간표 → 강의실을 읽는지 확인.
+메모리 SQLite에 강의 수를 늘려 가며 넣고, 응답을 만들 때처럼 전부 순회하는 동안 실행된 쿼리를 센다.
+
+    python script/check_lecture_queries.py
+
+강의 수에 따라 쿼리 수가 달라지면(N+1) 종료 코드 1.
+"""
+import sys
+import os
+from datetime import time
+
+# 필요시 backend 폴더를 path에 추가
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from sqlalchemy import create_engine, event, insert
+from sqlalchemy.orm import sessionmaker
+
+import models  # noqa: F401  (모든 모델을 metadata에 등록)
+from models.base import Base
+from models.lecture import Lecture
+from models.lecture_location import LectureLocation
+from models.lecture_schedule import LectureSchedule
+from models.user import User
+from models.user_lecture_map import user_lecture
+from services.lecture_service import load_user_lectures
+from utils.serializer import serialize_schedule
+
+COURSE_COUNTS = (1, 5, 20, 50)
+
+
+def seed(db, course_count):
+    user = User(name=f"user{course_count}")
+    db.add(user)
+    db.flush()
+    for i in range(course_count):
+        location = LectureLocation(
+            building_code=str(course_count), room_number=str(i), building_name="공학관", full_label=f"공학관 {i}호"
+        )
+        lecture = Lecture(
+            name=f"강의{i}", code=f"C{course_count:03d}{i:03d}", section="001", full_name=f"강의{i} (001)"
+        )
+        lecture.schedules = [
+            LectureSchedule(
+                weekday=day, start_time=time(9), end_time=time(10), duration=60,
+                location=f"{course_count}-{i}", location_details=location,
+            )
+            for day in (0, 2)
+        ]
+        db.add(lecture)
+        db.flush()
+        db.execute(insert(user_lecture).values(user_id=user.id, lecture_id=lecture.id))
+    db.commit()
+    return user.id
+
+
+def count_queries(engine, db, user_id):
+    statements = []
+
+    def record(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    db.expire_all()
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        lectures = load_user_lectures(db, user_id)
+        for lecture in lectures:
+            [serialize_schedule(sched) for sched in lecture.schedules]
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+    return len(lectures), len(statements)
+
+
+def main():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    db = sessionmaker(bind=engine)()
+
+    counts = set()
+    for course_count in COURSE_COUNTS:
+        user_id = seed(db, course_count)
+        loaded, queries = count_queries(engine, db, user_id)
+        counts.add(queries)
+        print(f"  강의 {loaded:3d}개 → 쿼리 {queries}번")
+
+    if len(counts) != 1:
+        print("❌ 강의 수에 따라 쿼리 수가 달라짐 (N+1)")
+        sys.exit(1)
+    print("✅ 강의 수와 상관없이 쿼리 수 일정")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+"""
+HTML 파서 백엔드(lxml / html.parser)와 SoupStrainer 사용 여부에 따라 파싱 결과가 같은지 확인하고 시간을 비교.
+저장해 둔 페이지(개인정보를 지운 PLATO/onestop 페이지)를 파일 이름 접두어로 구분해 해당 파서에 넣는다.
+
+    dashboard*.html   PLATO 대시보드          → parse_lecture_list
+    onestop*.html     onestop 강좌 조회 결과   → parse_catalog_rows
+    attendance*.html  my_status.php           → parse_attendance_page
+    form*.html        autoattendance.php      → 출석 폼 input 값
+
+    python script/check_parser_parity.py                 # script/recorded_pages 사용
+    python script/check_parser_parity.py 다른_폴더/
+    python script/check_parser_parity.py --update        # 기대 결과(*.expected.json) 다시 만들기
+
+각 페이지의 기대 결과는 <이름>.expected.json (기존 방식: html.parser, 전체 트리로 파싱한 결과).
+기대 결과 파일이 없는 페이지는 html.parser 전체 트리 결과와 비교한다.
+하나라도 다르면 종료 코드 1.
+"""
+import sys
+import os
+import argparse
+import json
+import logging
+import time
+
+# 필요시 backend 폴더를 path에 추가
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from bs4 import SoupStrainer
+from services.attendance_service import parse_attendance_page
+from services.lecture_service import parse_lecture_list
+from utils.html_parser import BACKENDS, HAS_LXML, make_soup, parser_override
+from utils.schedule_parser import parse_catalog_rows
+
+
+FORM_INPUTS = SoupStrainer("input")
+
+
+def parse_form(html):
+    soup = make_soup(html, FORM_INPUTS)
+    return {
+        name: (soup.find("input", {"name": name}) or {}).get("value")
+        for name in ("type", "id", "autoid", "sesskey")
+    }
+
+
+PARSERS = {
+    "dashboard": parse_lecture_list,
+    "onestop": parse_catalog_rows,
+    "attendance": parse_attendance_page,
+    "form": parse_form,
+}
+
+BASELINE = ("html.parser", False)
+
+RECORDED_PAGES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "recorded_pages")
+
+
+def normalize(result):
+    """튜플/리스트 차이 없이 비교하고 저장할 수 있도록 JSON 형태로 맞춤"""
+    return json.loads(json.dumps(result, ensure_ascii=False))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="HTML 파서 백엔드 결과 비교")
+    parser.add_argument("pages_dir", nargs="?", default=RECORDED_PAGES, help="저장해 둔 페이지(.html) 폴더")
+    parser.add_argument("--update", action="store_true", help="기준 파서 결과로 *.expected.json을 다시 씀")
+    parser.add_argument("--repeat", type=int, default=5, help="시간 측정 반복 횟수")
+    args = parser.parse_args()
+
+    # 정규식 불일치 경고 등은 반복 측정마다 찍히므로 숨김
+    logging.disable(logging.WARNING)
+
+    if not HAS_LXML:
+        print("⚠️ lxml이 설치되지 않아 lxml 백엔드는 html.parser로 대체되어 측정됩니다.")
+
+    variants = [(backend, strain) for backend in BACKENDS for strain in (False, True)]
+    timings = {variant: 0.0 for variant in variants}
+    mismatches = 0
+    checked = 0
+
+    for filename in sorted(os.listdir(args.pages_dir)):
+        kind = next((k for k in PARSERS if filename.startswith(k)), None)
+        if kind is None or not filename.endswith(".html"):
+            continue
+        with open(os.path.join(args.pages_dir, filename), encoding="utf-8") as f:
+            html = f.read()
+
+        with parser_override(*BASELINE):
+            baseline = normalize(PARSERS[kind](html))
+        expected_path = os.path.join(args.pages_dir, filename[:-len(".html")] + ".expected.json")
+        if args.update:
+            with open(expected_path, "w", encoding="utf-8") as f:
+                json.dump(baseline, f, ensure_ascii=False, indent=2)
+                f.write("\n")
+        if os.path.exists(expected_path):
+            with open(expected_path, encoding="utf-8") as f:
+                expected = json.load(f)
+        else:
+            expected = baseline
+
+        for variant in variants:
+            with parser_override(*variant):
+                start = time.perf_counter()
+                for _ in range(args.repeat):
+                    result = PARSERS[kind](html)
+                timings[variant] += (time.perf_counter() - start) / args.repeat
+            if normalize(result) != expected:
+                mismatches += 1
+                print(f"❌ {filename}: backend={variant[0]}, strain={variant[1]} 결과가 기준과 다름")
+        checked += 1
+
+    print(f"\n페이지 {checked}개 확인")
+    for (backend, strain), elapsed in timings.items():
+        print(f"  {backend:12s} strain={str(strain):5s} 합계 {elapsed * 1000:8.1f}ms")
+
+    if mismatches:
+        print(f"❌ 불일치 {mismatches}건")
+        sys.exit(1)
+    print("✅ 모든 백엔드 결과 일치")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+"""
+자주 실행되는 조회가 마이그레이션으로 추가한 인덱스를 실제로 타는지 EXPLAIN으로 확인.
+.env의 DB(또는 --url)에 `alembic upgrade head`가 적용돼 있어야 한다.
+
+    python script/check_query_plans.py
+    python script/check_query_plans.py --url sqlite:///./dev.db
+
+MySQL은 테이블이 비어 있으면 인덱스 대신 "Impossible WHERE"로 끝나므로 데이터가 있는 DB에서 돌릴 것.
+하나라도 기대한 인덱스를 쓰지 않으면 종료 코드 1.
+"""
+import sys
+import os
+import argparse
+from datetime import datetime, timedelta
+
+# 필요시 backend 폴더를 path에 추가
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from sqlalchemy import create_engine, select, text, tuple_
+
+from models.attendance import Attendance
+from models.lecture import Lecture
+from models.lecture_schedule import LectureSchedule
+from models.user_lecture_map import user_lecture
+
+now = datetime(2025, 3, 4, 0, 0)
+
+# (설명, 쿼리, 테이블, 허용하는 인덱스 이름들)
+# SQLite는 UNIQUE 제약을 sqlite_autoindex_<테이블>_N 이라는 이름의 인덱스로 만든다.
+HOT_QUERIES = [
+    (
+        "오늘 출석 여부 (already_attended_today)",
+        select(Attendance.id).where(
+            Attendance.user_id == 1,
+            Attendance.lecture_id == 1,
+            Attendance.timestamp >= now,
+            Attendance.timestamp < now + timedelta(days=1),
+        ).limit(1),
+        "attendance_log",
+        ("ix_attendance_user_lecture_time",),
+    ),
+    (
+        "출석 기록 페이지 (/api/attendance/logs)",
+        select(Attendance.id).where(
+            Attendance.user_id == 1,
+            (Attendance.timestamp < now) | ((Attendance.timestamp == now) & (Attendance.id < 100)),
+        ).order_by(Attendance.timestamp.desc(), Attendance.id.desc()).limit(51),
+        "attendance_log",
+        ("ix_attendance_user_time",),
+    ),
+    (
+        "강의 (code, section) 조회 (store_parsed_lectures)",
+        select(Lecture.id).where(tuple_(Lecture.code, Lecture.section).in_([("CB1500001", "001"), ("CB1500002", "002")])),
+        "lectures",
+        ("unique_lecture", "sqlite_autoindex_lectures_"),
+    ),
+    (
+        "PLATO 강의 ID 조회",
+        select(Lecture.id).where(Lecture.plato_course_id == 12345),
+        "lectures",
+        ("ix_lectures_plato_course_id",),
+    ),
+    (
+        "자동 출석 대상 (auto_attendance_runner)",
+        user_lecture.select().where(user_lecture.c.auto_attendance_enabled == True),
+        "user_lecture",
+        ("ix_user_lecture_auto_attendance",),
+    ),
+    (
+        "요일 필터 (/api/lectures/all)",
+        select(LectureSchedule.lecture_id).where(LectureSchedule.weekday == 0),
+        "lecture_schedule",
+        ("ix_lecture_schedule_weekday_lecture",),
+    ),
+]
+
+
+def used_indexes(conn, sql, table):
+    """EXPLAIN 결과에서 table에 쓰인 인덱스 이름과 원본 계획 문자열 반환."""
+    if conn.dialect.name == "sqlite":
+        plan = [row.detail for row in conn.execute(text(f"EXPLAIN QUERY PLAN {sql}"))]
+        names = {
+            detail.split(" INDEX ", 1)[1].split(" ", 1)[0]
+            for detail in plan
+            if table in detail and " INDEX " in detail
+        }
+        return names, plan
+    plan = [dict(row._mapping) for row in conn.execute(text(f"EXPLAIN {sql}"))]
+    names = {row.get("key") for row in plan if row.get("table") == table and row.get("key")}
+    return names, plan
+
+
+def main():
+    parser = argparse.ArgumentParser(description="자주 쓰는 조회의 인덱스 사용 여부 확인")
+    parser.add_argument("--url", help="DB 주소 (기본: settings.SQLALCHEMY_DATABASE_URL)")
+    args = parser.parse_args()
+
+    if args.url:
+        engine = create_engine(args.url)
+    else:
+        from database import engine
+
+    failures = 0
+    with engine.connect() as conn:
+        for label, query, table, expected in HOT_QUERIES:
+            sql = str(query.compile(dialect=conn.dialect, compile_kwargs={"literal_binds": True}))
+            names, plan = used_indexes(conn, sql, table)
+            if any(name.startswith(prefix) for name in names for prefix in expected):
+                print(f"✅ {label}: {', '.join(sorted(names))}")
+            else:
+                failures += 1
+                print(f"❌ {label}: 기대 인덱스 {expected[0]}, 실제 {sorted(names) or '없음'}")
+                for line in plan:
+                    print(f"     {line}")
+
+    if failures:
+        print(f"\n❌ {failures}개 쿼리가 기대한 인덱스를 쓰지 않음")
+        sys.exit(1)
+    print("\n✅ 모든 쿼리가 인덱스 사용")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+onestop 강좌 목록을 학기 단위로 한 번에 수집해 DB와 스냅샷 파일에 반영하는 오프라인 스크립트.
+
+    # onestop 전체 목록 수집 → DB 반영 + 스냅샷 저장
+    python script/ingest_catalog.py crawl
+
+    # 새 배포 환경에서 스냅샷만 빠르게 반영 (브라우저 불필요)
+    python script/ingest_catalog.py import script/snapshots/catalog_2025-1_20250302T0900.json.gz
+"""
+import sys
+import os
+import argparse
+import asyncio
+import logging
+from datetime import datetime
+
+# 필요시 backend 폴더를 path에 추가
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from database import SessionLocal
+from services.catalog_ingest import build_snapshot, write_snapshot, read_snapshot, load_snapshot
+from services.onestop_catalog import crawl_catalog
+from utils.browser_pool import browser_pool
+from utils.semester import current_semester
+
+SNAPSHOT_DIR = os.path.join(os.path.dirname(__file__), "snapshots")
+
+
+def apply_snapshot(snapshot):
+    db = SessionLocal()
+    try:
+        return load_snapshot(db, snapshot)
+    finally:
+        db.close()
+
+
+async def crawl(semester, max_pages):
+    try:
+        rows = await crawl_catalog(max_pages=max_pages)
+    finally:
+        await browser_pool.stop()
+    return build_snapshot(rows, semester)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="onestop 강좌 목록 일괄 수집/반영")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    crawl_parser = sub.add_parser("crawl", help="onestop 전체 강좌 목록을 수집해 DB와 스냅샷에 저장")
+    crawl_parser.add_argument("--semester", default=current_semester(), help="스냅샷에 기록할 학기 (기본: 현재 학기)")
+    crawl_parser.add_argument("--max-pages", type=int, default=1000, help="최대 수집 페이지 수")
+    crawl_parser.add_argument("--out", help="스냅샷 파일 경로 (기본: script/snapshots/catalog_<학기>_<시각>.json.gz)")
+    crawl_parser.add_argument("--no-db", action="store_true", help="DB에는 반영하지 않고 스냅샷만 저장")
+
+    import_parser = sub.add_parser("import", help="스냅샷 파일을 DB에 반영")
+    import_parser.add_argument("path", help="스냅샷 파일 경로 (.json.gz)")
+
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s")
+
+    if args.command == "import":
+        snapshot = read_snapshot(args.path)
+        result = apply_snapshot(snapshot)
+        print(f"✅ 스냅샷 반영 완료 ({snapshot['semester']}, 생성 {snapshot['generated_at']}): {result}")
+        return
+
+    snapshot = asyncio.run(crawl(args.semester, args.max_pages))
+    out = args.out
+    if not out:
+        os.makedirs(SNAPSHOT_DIR, exist_ok=True)
+        stamp = datetime.now().strftime("%Y%m%dT%H%M")
+        out = os.path.join(SNAPSHOT_DIR, f"catalog_{args.semester}_{stamp}.json.gz")
+    write_snapshot(snapshot, out)
+    print(f"✅ 스냅샷 저장: {out} (강의 {len(snapshot['lectures'])}개)")
+
+    if not args.no_db:
+        result = apply_snapshot(snapshot)
+        print(f"✅ DB 반영 완료: {result}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+import base64
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import and_, func, or_, select
+from sqlalchemy.orm import Session
+
+from models.attendance import Attendance
+from models.lecture import Lecture
+
+KST = timezone(timedelta(hours=9))
+
+# 한 페이지 최대 건수
+MAX_PAGE_SIZE = 200
+
+
+def encode_cursor(timestamp, attendance_id):
+    raw = f"{timestamp.isoformat()}|{attendance_id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor):
+    """잘못된 커서면 ValueError"""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        timestamp, attendance_id = raw.split("|")
+        return datetime.fromisoformat(timestamp), int(attendance_id)
+    except Exception as e:
+        raise ValueError(f"잘못된 커서: {cursor}") from e
+
+
+def _kst_day_start_utc(day):
+    """KST 기준 그 날 0시를 DB에 저장된 형식(UTC, tz 없음)으로"""
+    return datetime(day.year, day.month, day.day, tzinfo=KST).astimezone(timezone.utc).replace(tzinfo=None)
+
+
+def list_attendance_logs(db: Session, user_id, limit=50, cursor=None, lecture_id=None, date_from=None, date_to=None):
+    """
+    사용자의 출석 기록을 최신순으로 한 페이지씩 반환. (timestamp, id) keyset 페이지네이션.
+    - cursor: 이전 페이지의 next_cursor
+    - lecture_id: 특정 강의만
+    - date_from / date_to: KST 날짜 범위 (양 끝 포함)
+    total은 같은 조건의 COUNT(*) (user_id로 시작하는 인덱스만 읽음)
+    """
+    conditions = [Attendance.user_id == user_id]
+    if lecture_id is not None:
+        conditions.append(Attendance.lecture_id == lecture_id)
+    if date_from is not None:
+        conditions.append(Attendance.timestamp >= _kst_day_start_utc(date_from))
+    if date_to is not None:
+        conditions.append(Attendance.timestamp < _kst_day_start_utc(date_to + timedelta(days=1)))
+
+    total = db.execute(select(func.count()).select_from(Attendance).where(*conditions)).scalar_one()
+
+    if cursor:
+        last_timestamp, last_id = decode_cursor(cursor)
+        conditions.append(or_(
+            Attendance.timestamp < last_timestamp,
+            and_(Attendance.timestamp == last_timestamp, Attendance.id < last_id),
+        ))
+
+    rows = db.execute(
+        select(Attendance, Lecture.name)
+        .outerjoin(Lecture, Lecture.id == Attendance.lecture_id)
+        .where(*conditions)
+        .order_by(Attendance.timestamp.desc(), Attendance.id.desc())
+        .limit(limit + 1)
+    ).all()
+
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    logs = [
+        {
+            "attendance_id": log.id,  # 출석 고유 ID
+            "lecture_id": log.lecture_id,  # 강의 ID
+            "lecture_name": lecture_name,  # 강의명
+            "timestamp": log.timestamp.isoformat(),  # 출석 시각(UTC)
+            "type": log.type,  # 출석 타입
+            "auth_code": log.auth_code  # 인증 코드
+        }
+        for log, lecture_name in rows
+    ]
+    next_cursor = encode_cursor(rows[-1][0].timestamp, rows[-1][0].id) if has_more else None
+    return {"attendances": logs, "count": len(logs), "total": total, "next_cursor": next_cursor}
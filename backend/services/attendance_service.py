@@ -1,41 +1,28 @@
-from playwright.async_api import async_playwright
-from bs4 import BeautifulSoup
+from bs4 import SoupStrainer
 from datetime import datetime
+from urllib.parse import urljoin
 
-from utils.auth_helper import decrypt
-from utils.plato_login import get_plato_session
+from utils.html_parser import make_soup
+from utils.plato_http import plato_http
 from utils.attendance_summary import summarize_attendance_with_redemption
 
-# --- get_attendance_summary_for_user 함수 추가 ---
-async def get_attendance_summary_for_user(user, plato_course_id):
-    async with async_playwright() as p:
-        student_id = user.student_id
-        student_pw = decrypt(user.student_password_encrypted)
-
-        browser, page = await get_plato_session(p, user)
+# 출석 현황 표, 또는 자동 출석 페이지의 '출석 현황' 링크만 있으면 됨
+ATTENDANCE_PAGE = SoupStrainer(["table", "a"])
 
-        try:
-            # 출석 상태 페이지로 이동
-            await page.goto(f'https://plato.pusan.ac.kr/local/ubattendance/my_status.php?id={plato_course_id}')
-            
-            # 자동 출석 페이지로 리다이렉트되는지 확인
-            if "autoattendance" in page.url:
-                # '출석 현황' 링크를 찾아 클릭
-                await page.click('a.nav-link[title="출석 현황"]')
-                # 다시 매뉴얼 출석 페이지에서 테이블 로딩을 기다림
-                await page.wait_for_selector("table.attendance_my")
-            
-            html = await page.content()
-            
-        finally:
-            await browser.close()
 
-    soup = BeautifulSoup(html, "html.parser")
+def parse_attendance_page(html):
+    """
+    my_status.php HTML에서 (출석 기록 목록, '출석 현황' 링크) 반환.
+    출석 현황 표가 없으면 기록 자리에 None.
+    """
+    soup = make_soup(html, ATTENDANCE_PAGE)
     table = soup.find("table", class_="attendance_my")
-    rows = table.tbody.find_all("tr")
+    if table is None:
+        link = soup.select_one('a.nav-link[title="출석 현황"]')
+        return None, link.get("href") if link else None
 
     records = []
-    for row in rows:
+    for row in table.tbody.find_all("tr"):
         cols = row.find_all("td")
         date = cols[0].get_text(strip=True)
         period = cols[1].get_text(strip=True)
@@ -56,9 +43,26 @@ async def get_attendance_summary_for_user(user, plato_course_id):
             "period": period,
             "status": status
         })
+    return records, None
+
+
+# --- get_attendance_summary_for_user 함수 추가 ---
+async def get_attendance_summary_for_user(user, plato_course_id):
+    # 출석 상태 페이지는 JS가 필요 없으므로 브라우저 없이 HTTP로 바로 읽음
+    url = f'https://plato.pusan.ac.kr/local/ubattendance/my_status.php?id={plato_course_id}'
+    html = await plato_http.get_html(user, url)
+    records, status_link = parse_attendance_page(html)
+
+    # 자동 출석 페이지로 리다이렉트된 경우 '출석 현황' 링크를 따라감
+    if records is None:
+        if not status_link:
+            raise Exception("출석 현황 테이블을 찾을 수 없습니다.")
+        html = await plato_http.get_html(user, urljoin(url, status_link))
+        records, _ = parse_attendance_page(html)
+        if records is None:
+            raise Exception("출석 현황 테이블을 찾을 수 없습니다.")
 
     return {
         "records": records,
         "summary": summarize_attendance_with_redemption(records)
     }
-
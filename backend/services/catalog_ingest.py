@@ -0,0 +1,140 @@
+import gzip
+import json
+import logging
+from datetime import datetime, time, timezone
+
+from sqlalchemy import delete, insert, update
+from sqlalchemy.orm import Session
+
+from models.lecture import Lecture
+from models.lecture_schedule import LectureSchedule
+from services.lecture_service import WEEKDAY_MAP, find_lecture_ids
+from services.location_service import upsert_locations
+from utils.chunking import chunks
+from utils.location_parser import parse_locations
+
+# 스냅샷 파일 형식 버전. 구조가 바뀌면 올리고 read_snapshot에서 거부한다.
+SNAPSHOT_VERSION = 1
+
+def build_snapshot(rows, semester):
+    """
+    onestop 강좌 목록 행(parse_catalog_rows 결과)을 스냅샷 dict로 정리.
+    같은 (code, section)의 행은 합치고, 시간 정보가 불완전한 블록은 save_schedule_to_db와 같은 기준으로 버린다.
+    """
+    lectures = {}
+    for row in rows:
+        key = (row["code"], row["section"])
+        lec = lectures.setdefault(key, {
+            "code": row["code"],
+            "section": row["section"],
+            "name": row["name"],
+            "schedules": [],
+        })
+        for block in row["blocks"]:
+            weekday = WEEKDAY_MAP.get(block["weekday"])
+            if weekday is None or not block["start_time"] or not block["end_time"] or not block["duration"]:
+                continue
+            entry = {
+                "weekday": weekday,
+                "start_time": block["start_time"],
+                "end_time": block["end_time"],
+                "duration": block["duration"],
+                "location": block["location"],
+            }
+            if entry not in lec["schedules"]:
+                lec["schedules"].append(entry)
+
+    return {
+        "version": SNAPSHOT_VERSION,
+        "semester": semester,
+        "generated_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "lectures": list(lectures.values()),
+    }
+
+
+def write_snapshot(snapshot, path):
+    with gzip.open(path, "wt", encoding="utf-8") as f:
+        json.dump(snapshot, f, ensure_ascii=False, separators=(",", ":"))
+
+
+def read_snapshot(path):
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        snapshot = json.load(f)
+    if snapshot.get("version") != SNAPSHOT_VERSION:
+        raise ValueError(f"지원하지 않는 스냅샷 버전: {snapshot.get('version')} (필요: {SNAPSHOT_VERSION})")
+    return snapshot
+
+
+def load_snapshot(db: Session, snapshot):
+    """
+    스냅샷을 DB에 일괄 반영.
+    - 없는 강의는 한 번에 INSERT, 있는 강의는 그대로 둠 (plato_course_id 등 유지)
+    - 시간표가 있는 강의는 기존 시간표를 지우고 스냅샷 내용으로 교체, 강의실도 함께 연결
+    - 교체한 강의는 스냅샷 학기로 시간표 캐시를 찍어 onestop 재조회를 생략하게 함
+    """
+    lectures = snapshot["lectures"]
+    semester = snapshot["semester"]
+    keys = [(lec["code"], lec["section"]) for lec in lectures]
+
+    lecture_ids = find_lecture_ids(db, keys)
+    new_lectures = [
+        {
+            "name": lec["name"],
+            "code": lec["code"],
+            "section": lec["section"],
+            "full_name": f"{lec['name']} ({lec['code']}-{lec['section']})",
+        }
+        for lec in lectures
+        if (lec["code"], lec["section"]) not in lecture_ids
+    ]
+    if new_lectures:
+        db.execute(insert(Lecture), new_lectures)
+        lecture_ids = find_lecture_ids(db, keys)
+
+    texts = [sched["location"] for lec in lectures for sched in lec["schedules"] if sched["location"]]
+    parsed_by_text = parse_locations(texts)
+    location_ids, new_locations = upsert_locations(db, parsed_by_text.values())
+    location_of = {
+        text: (parsed["building_code"], parsed["room"])
+        for text, parsed in parsed_by_text.items()
+        if parsed["type"] == "offline"
+    }
+
+    scheduled_ids = [lecture_ids[(lec["code"], lec["section"])] for lec in lectures if lec["schedules"]]
+    for chunk in chunks(scheduled_ids):
+        db.execute(delete(LectureSchedule).where(LectureSchedule.lecture_id.in_(chunk)))
+
+    schedule_rows = []
+    for lec in lectures:
+        lecture_id = lecture_ids[(lec["code"], lec["section"])]
+        for sched in lec["schedules"]:
+            location_key = location_of.get(sched["location"])
+            schedule_rows.append({
+                "lecture_id": lecture_id,
+                "weekday": sched["weekday"],
+                "start_time": time(*[int(p) for p in sched["start_time"].split(":")]),
+                "end_time": time(*[int(p) for p in sched["end_time"].split(":")]),
+                "duration": sched["duration"],
+                "location": sched["location"],
+                "lecture_location_id": location_ids.get(location_key) if location_key else None,
+            })
+    if schedule_rows:
+        db.execute(insert(LectureSchedule), schedule_rows)
+
+    synced_at = datetime.now(timezone.utc).replace(tzinfo=None)
+    for chunk in chunks(scheduled_ids):
+        db.execute(
+            update(Lecture)
+            .where(Lecture.id.in_(chunk))
+            .values(schedule_semester=semester, schedule_synced_at=synced_at)
+        )
+    db.commit()
+
+    result = {
+        "lectures": len(lectures),
+        "new_lectures": len(new_lectures),
+        "schedules": len(schedule_rows),
+        "new_locations": new_locations,
+    }
+    logging.info(f"[강좌 스냅샷 반영] semester={semester}, {result}")
+    return result
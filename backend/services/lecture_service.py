@@ -1,19 +1,27 @@
+import hashlib
 import logging
 import re
-from datetime import time
+from datetime import time, datetime, timedelta, timezone
 
-from bs4 import BeautifulSoup
-from playwright.async_api import async_playwright
+from bs4 import SoupStrainer
 
-from sqlalchemy.orm import Session
+from sqlalchemy import update, select, insert, delete, tuple_, func
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session, object_session, selectinload
 from fastapi import Depends
 from database import get_db
+from config.config import settings
 from models.lecture import Lecture
 from models.lecture_schedule import LectureSchedule
+from models.user_lecture_map import user_lecture
 
-from utils.schedule_parser import parse_schedule
+from services.onestop_catalog import catalog_client
 
+from utils.chunking import chunks
+from utils.html_parser import make_soup
 from utils.schedule_checker import is_currently_in_lecture
+from utils.semester import current_semester
 # 요일 변환 맵
 WEEKDAY_MAP = {
     "월": 0,
@@ -32,6 +40,17 @@ def save_schedule_to_db(course_code, section_number, schedule_data, db: Session)
         print(f"❌ 해당 강의 없음: {course_code}-{section_number}")
         return
 
+    semester = current_semester()
+    has_valid_entry = any(
+        WEEKDAY_MAP.get(e["weekday"]) is not None and e["start_time"] and e["end_time"] and e["duration"]
+        for e in schedule_data
+    )
+    # 학기가 바뀌었으면 지난 학기 시간표는 버리고 새로 저장 (조회 결과가 비었을 때는 유지)
+    if has_valid_entry and lecture.schedule_semester and lecture.schedule_semester != semester:
+        logging.info(f"[학기 변경 → 기존 시간표 교체] {lecture.schedule_semester} → {semester}, {lecture.full_name}")
+        lecture.schedules.clear()
+        db.flush()
+
     # 현재 이 강의의 기존 시간표 가져오기
     existing_schedules = db.query(LectureSchedule).filter_by(lecture_id=lecture.id).all()
 
@@ -81,15 +100,73 @@ def save_schedule_to_db(course_code, section_number, schedule_data, db: Session)
             print(f"❌ 시간표 저장 중 오류 발생: {e}")
 
     print(f"[DEBUG] 총 저장 시도 완료: {len(schedule_data)}개")
+    # onestop이 답했으면 결과가 비어 있어도(시간표 없는 강의) 조회 시각을 기록해 같은 분반은 재사용함
+    # 단, 빈 결과로 지난 학기 시간표를 남겨 둔 경우는 다음에 다시 조회하도록 기록하지 않음
+    kept_previous_semester = not has_valid_entry and lecture.schedule_semester not in (None, semester)
+    if not kept_previous_semester:
+        lecture.schedule_semester = semester
+        lecture.schedule_synced_at = datetime.now(timezone.utc).replace(tzinfo=None)
     db.commit()
     print(f"✅ 시간표 저장 완료: {lecture.full_name}")
 
 
 
+def is_schedule_fresh(lecture, semester=None):
+    """
+    lecture에 저장된 시간표를 onestop 재조회 없이 그대로 써도 되는지 판단.
+    이번 학기에 가져왔고 SCHEDULE_CACHE_MAX_AGE_DAYS 이내여야 함.
+    시간표가 비어 있어도 조회 시각이 있으면 그대로 씀 (시간표 없는 강의를 매번 다시 조회하지 않도록).
+    """
+    if lecture is None or lecture.schedule_synced_at is None:
+        return False
+    if lecture.schedule_semester != (semester or current_semester()):
+        return False
+    age = datetime.now(timezone.utc).replace(tzinfo=None) - lecture.schedule_synced_at
+    return age <= timedelta(days=settings.SCHEDULE_CACHE_MAX_AGE_DAYS)
+
+
+def cached_schedule(lecture):
+    """저장된 시간표를 parse_schedule 결과와 같은 형태의 dict 목록으로 변환."""
+    weekdays = {v: k for k, v in WEEKDAY_MAP.items()}
+    return [
+        {
+            "weekday": weekdays[sched.weekday],
+            "start_time": sched.start_time.strftime("%H:%M"),
+            "end_time": sched.end_time.strftime("%H:%M"),
+            "duration": sched.duration,
+            "location": sched.location,
+        }
+        for sched in lecture.schedules
+    ]
+
+
+def invalidate_schedule_cache(db: Session, lecture_ids=None):
+    """
+    시간표 캐시를 무효화. lecture_ids가 없으면 전체 강의 대상.
+    다음 동기화 때 onestop에서 다시 가져온다. 무효화된 강의 수를 반환.
+    """
+    stmt = update(Lecture).values(schedule_synced_at=None)
+    if lecture_ids is not None:
+        stmt = stmt.where(Lecture.id.in_(lecture_ids))
+    result = db.execute(stmt)
+    db.commit()
+    return result.rowcount
+
+
+# 대시보드 강의 카드(course/view.php 링크와 그 안의 제목)만 파싱
+DASHBOARD_COURSES = SoupStrainer("a", href=re.compile(r"/course/view\.php\?"))
+
+
 def parse_lecture_list(html):
-    soup = BeautifulSoup(html, "html.parser")
+    """
+    PLATO 대시보드 HTML에서 수강 강의 목록을 파싱.
+    강의 카드의 링크(course/view.php?id=...)에서 plato_course_id도 함께 뽑는다.
+    """
+    soup = make_soup(html, DASHBOARD_COURSES)
     titles = soup.select("div.course-title")
-
+    if not titles:
+        # 강의 카드가 링크 밖에 있는 레이아웃이면 전체 문서에서 다시 찾음
+        titles = make_soup(html).select("div.course-title")
     lectures = []
     for tag in titles:
         raw = tag.get_text(strip=True)
@@ -101,120 +178,167 @@ def parse_lecture_list(html):
                 "name": name,
                 "code": code,
                 "section": section,
-                "full_name": full_name
+                "full_name": full_name,
+                "plato_course_id": _course_id_of(tag),
             })
         else:
             logging.warning(f"[⚠️ 정규식 불일치]: {raw}")
     return lectures
 
-def store_parsed_lectures(lecture_dicts, db: Session):
-    existing_lectures = {
-        (lec.code, lec.section) for lec in db.query(Lecture).all()
-    }
 
+def _course_id_of(title_tag):
+    """강의 카드 제목을 감싼 링크에서 course id를 추출. 링크가 없으면 None."""
+    link = title_tag.find_parent("a", href=True)
+    if link is None:
+        link = title_tag.find("a", href=True)
+    if link is None:
+        return None
+    match = re.search(r"/course/view\.php\?(?:.*&)?id=(\d+)", link["href"])
+    return int(match.group(1)) if match else None
+
+
+def _lecture_upsert_statement(db: Session, rows):
+    """
+    (code, section) 유니크 제약 기준 다중 행 upsert.
+    이미 있는 강의는 이름을 건드리지 않고, 새 plato_course_id가 있을 때만 갱신한다.
+    """
+    dialect = db.get_bind().dialect.name
+    if dialect == "mysql":
+        stmt = mysql_insert(Lecture).values(rows)
+        return stmt.on_duplicate_key_update(
+            plato_course_id=func.coalesce(stmt.inserted.plato_course_id, Lecture.plato_course_id)
+        )
+    if dialect == "sqlite":
+        stmt = sqlite_insert(Lecture).values(rows)
+        return stmt.on_conflict_do_update(
+            index_elements=["code", "section"],
+            set_={"plato_course_id": func.coalesce(stmt.excluded.plato_course_id, Lecture.plato_course_id)},
+        )
+    return None
+
+
+def find_lecture_ids(db: Session, keys):
+    """(code, section) → lectures.id. 전체 강의가 아니라 요청한 키만 CHUNK_SIZE개씩 IN으로 조회."""
+    ids = {}
+    for chunk in chunks(keys):
+        rows = db.query(Lecture.id, Lecture.code, Lecture.section).filter(
+            tuple_(Lecture.code, Lecture.section).in_(chunk)
+        )
+        for lecture_id, code, section in rows:
+            ids[(code, section)] = lecture_id
+    return ids
+
+
+def store_parsed_lectures(lecture_dicts, db: Session):
+    """
+    대시보드 강의들을 lectures에 upsert하고 (code, section) → lectures.id 매핑 반환.
+    사용자가 듣는 강의 수만큼만 다루므로 전체 강의 목록은 읽지 않는다.
+    """
+    rows = {}
     for lec in lecture_dicts:
-        key = (lec["code"], lec["section"])
-        if key not in existing_lectures:
-            new_lecture = Lecture(
-                name=lec["name"],
-                code=lec["code"],
-                section=lec["section"],
-                full_name=lec["full_name"]
-            )
-            db.add(new_lecture)
+        rows[(lec["code"], lec["section"])] = {
+            "name": lec["name"],
+            "code": lec["code"],
+            "section": lec["section"],
+            "full_name": lec["full_name"],
+            "plato_course_id": lec.get("plato_course_id"),
+        }
+    if not rows:
+        return {}
+
+    stmt = _lecture_upsert_statement(db, list(rows.values()))
+    if stmt is not None:
+        db.execute(stmt)
+    else:
+        # upsert를 지원하지 않는 DB: 있는 강의만 IN으로 확인하고 나머지를 한 번에 추가
+        existing = find_lecture_ids(db, rows)
+        missing = [row for key, row in rows.items() if key not in existing]
+        if missing:
+            db.execute(insert(Lecture), missing)
+        changed = [
+            {"id": existing[key], "plato_course_id": row["plato_course_id"]}
+            for key, row in rows.items()
+            if key in existing and row["plato_course_id"]
+        ]
+        if changed:
+            db.execute(update(Lecture), changed)
     db.commit()
-    
-    
-
-def enroll_user_in_lectures(user, lecture_dicts, db: Session):
-    all_lectures = {
-        (lec.code, lec.section): lec for lec in db.query(Lecture).all()
+    return find_lecture_ids(db, rows)
+
+
+def lecture_list_hash(lecture_dicts):
+    """대시보드 강의 목록의 해시. 이전 동기화 때와 같으면 수강 목록이 바뀌지 않은 것."""
+    keys = sorted(f"{lec['code']}-{lec['section']}:{lec.get('plato_course_id') or ''}" for lec in lecture_dicts)
+    return hashlib.sha256("\n".join(keys).encode()).hexdigest()
+
+
+def enroll_user_in_lectures(user, lecture_dicts, db: Session, lecture_ids=None):
+    """
+    user_lecture를 대시보드 강의 목록과 맞춤. 새로 생긴 강의만 추가하고 빠진 강의만 삭제하므로
+    남아 있는 강의의 행(auto_attendance_enabled 등 플래그)은 그대로 유지된다.
+    lecture_dicts가 비어 있으면 아무것도 바꾸지 않는다.
+    lecture_ids: store_parsed_lectures가 돌려준 매핑 (없으면 IN 조회)
+    (추가된 lecture_id 집합, 삭제된 lecture_id 집합) 반환.
+    """
+    keys = {(lec["code"], lec["section"]) for lec in lecture_dicts}
+    if not keys:
+        # 빈 목록은 대시보드를 제대로 못 읽은 경우라 기존 수강 목록을 지우지 않음
+        logging.warning(f"[수강 목록 갱신 생략] user={user.id}, 강의 목록이 비어 있음")
+        return set(), set()
+    if lecture_ids is None:
+        lecture_ids = find_lecture_ids(db, keys)
+    target = {lecture_ids[key] for key in keys if key in lecture_ids}
+    current = {
+        lecture_id for (lecture_id,) in db.execute(
+            select(user_lecture.c.lecture_id).where(user_lecture.c.user_id == user.id)
+        )
     }
-    user_lecture_keys = {(lec.code, lec.section) for lec in user.lectures}
 
-    for lec in lecture_dicts:
-        key = (lec["code"], lec["section"])
-        if key not in user_lecture_keys:
-            lecture = all_lectures.get(key)
-            if lecture:
-                user.lectures.append(lecture)
+    added = target - current
+    removed = current - target
+    if added:
+        db.execute(insert(user_lecture), [{"user_id": user.id, "lecture_id": i} for i in added])
+    if removed:
+        db.execute(
+            delete(user_lecture).where(
+                (user_lecture.c.user_id == user.id) & (user_lecture.c.lecture_id.in_(removed))
+            )
+        )
     db.commit()
+    # 관계 컬렉션을 다시 읽도록 만료
+    db.expire(user, ["lectures"])
+    return added, removed
+
+def load_user_lectures(db: Session, user_id, auto_attendance_only=False):
+    """
+    사용자의 수강 강의를 시간표·강의실까지 한 번에 읽어옴.
+    강의 수와 상관없이 쿼리 2번 (강의 1번, 시간표+강의실 1번)이라 lec.schedules / sched.location_details를
+    순회해도 추가 쿼리가 나가지 않는다.
+    auto_attendance_only=True면 자동 출석이 켜진 강의만.
+    """
+    query = (
+        db.query(Lecture)
+        .join(user_lecture, user_lecture.c.lecture_id == Lecture.id)
+        .filter(user_lecture.c.user_id == user_id)
+        .options(selectinload(Lecture.schedules).joinedload(LectureSchedule.location_details))
+        .order_by(Lecture.id)
+    )
+    if auto_attendance_only:
+        query = query.filter(user_lecture.c.auto_attendance_enabled == True)
+    return query.all()
+
 
 def show_user_lectures(user):
-    return user.lectures  # Lecture 객체 리스트 그대로 반환
+    return load_user_lectures(object_session(user), user.id)  # Lecture 객체 리스트 (시간표/강의실 포함)
 
 
 def find_current_lecture(user):
-    for lecture in user.lectures:
+    for lecture in show_user_lectures(user):
         for schedule in lecture.schedules:
             if is_currently_in_lecture(schedule):
                 return lecture
     return None
 
 
-async def get_schedule(course_code, section_number, subject_name, playwright=None):
-    should_close = False
-
-    if playwright is None:
-        playwright = await async_playwright().start()
-        should_close = True
-
-    browser = await playwright.chromium.launch(headless=True)
-    context = await browser.new_context(accept_downloads=True)
-    page = await context.new_page()
-
-    try:
-        await page.goto("https://onestop.pusan.ac.kr/page?menuCD=000000000000335")
-        await page.wait_for_load_state("networkidle")
-
-        # 🔍 검색 조건 입력
-        await page.click('.select-pure__select')
-        await page.click('.select-pure__option[data-value="0001"]')
-        await page.click('input#SEARCH_GBN2')
-        await page.fill('#SCH_SUBJ_NM', subject_name)
-        await page.click('button:has-text("조회")')
-        # ✅ 데이터 충분히 로드됐는지 확인
-        try:
-            await page.wait_for_function(
-                "document.querySelectorAll('#resultTbody > tr').length >= 1", timeout=7000
-            )
-        except Exception as e:
-            print(f"⚠️ wait_for_function 실패 → 강의 로드가 느릴 수 있음: {e}")
-            await page.wait_for_timeout(2000)  # fallback으로 2초 대기
-
-        # ✅ 강의명이 실제로 나타나는 것도 확인
-        await page.wait_for_selector(f"text={subject_name}", timeout=5000)
-        # ✅ 첫 페이지 내용 파싱
-        html = await page.content()
-        schedules = parse_schedule(html, course_code, section_number)
-        previous_html = html
-
-        page_count = 1
-        max_pages = 20
-
-        while not schedules:
-            print(f"[🔄 {page_count} 페이지 탐색 중...]")
-            await page.click("#resultTbody_Next")
-            await page.wait_for_selector("#resultTbody > tr")
-            html = await page.content()
-
-            if html == previous_html:
-                print("🚫 동일 페이지 반복 → 마지막 페이지로 판단, 탐색 중단.")
-                break
-
-            previous_html = html
-            schedules = parse_schedule(html, course_code, section_number)
-
-            page_count += 1
-            if page_count > max_pages:
-                print("⚠️ 페이지 탐색 최대 횟수 초과. 중단.")
-                break
-
-        return schedules
-
-    finally:
-        await browser.close()
-        print("🧹 브라우저 정상 종료")
-        if should_close:
-            await playwright.stop()
-            print("🧹 Playwright 세션 종료")
+async def get_schedule(course_code, section_number, subject_name):
+    return await catalog_client.lookup(course_code, section_number, subject_name)
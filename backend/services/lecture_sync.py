@@ -0,0 +1,210 @@
+import asyncio
+import logging
+import time
+import uuid
+
+from config.config import settings
+from database import SessionLocal
+from models.user import User
+from services.lecture_service import (
+    parse_lecture_list,
+    store_parsed_lectures,
+    enroll_user_in_lectures,
+    lecture_list_hash,
+    save_schedule_to_db,
+    is_schedule_fresh,
+    cached_schedule,
+    load_user_lectures,
+)
+from services.onestop_catalog import catalog_client
+from utils.plato_http import plato_http
+
+PLATO_DASHBOARD_URL = "https://plato.pusan.ac.kr"
+
+
+async def sync_user_lectures(user, db, emit, force=False):
+    """
+    PLATO 대시보드의 수강 강의 목록과 onestop 시간표를 DB에 반영.
+    - 수강 목록은 바뀐 강의만 추가/삭제 (user_lecture 플래그 유지)
+    - 시간표는 처음 보거나 오래된 강의만 조회
+    - 강의 목록 해시가 지난번과 같고 시간표도 모두 최신이면 동기화 전체를 건너뜀 (force면 무시)
+    진행 상황은 emit(step, **data)로 알린다. 반환값은 API 응답 본문.
+    """
+    # 대시보드(강의 목록)는 브라우저 없이 HTTP로 읽음. plato_course_id도 여기서 함께 얻음
+    html = await plato_http.get_html(user, PLATO_DASHBOARD_URL)
+    lectures = parse_lecture_list(html)
+    if not lectures:
+        # 만료/손님/오류 페이지를 "수강 강의 없음"으로 믿으면 user_lecture(자동 출석 설정 포함)가 모두 지워지므로 중단
+        raise Exception("PLATO 대시보드에서 수강 강의를 찾지 못했습니다. 잠시 후 다시 시도해 주세요.")
+    list_hash = lecture_list_hash(lectures)
+    unchanged = not force and user.lecture_list_hash == list_hash
+    emit("dashboard", lecture_count=len(lectures), unchanged=unchanged)
+
+    if not unchanged:
+        lecture_ids = store_parsed_lectures(lectures, db)
+        added, removed = enroll_user_in_lectures(user, lectures, db, lecture_ids)
+        emit("enrollment", added=len(added), removed=len(removed))
+
+    # 같은 분반 시간표가 이미 최신이면 onestop을 건너뛰고 저장된 시간표를 재사용
+    # 시간표까지 한 번에 읽어 강의마다 lecture.schedules를 따로 조회하지 않도록 함
+    enrolled = {(l.code, l.section): l for l in load_user_lectures(db, user.id)}
+    to_fetch = []
+    for lec in lectures:
+        db_lecture = enrolled.get((lec["code"], lec["section"]))
+        if is_schedule_fresh(db_lecture):
+            lec["schedule"] = cached_schedule(db_lecture)
+            emit("schedule", lecture=lec["full_name"], source="cache", schedule=lec["schedule"])
+        else:
+            to_fetch.append(lec)
+    logging.info(f"[시간표 캐시] 재사용 {len(lectures) - len(to_fetch)}개, 조회 {len(to_fetch)}개")
+
+    if unchanged and not to_fetch:
+        logging.info(f"[강의 동기화 생략] user={user.id}, 강의 목록 변경 없음")
+        emit("skipped", reason="unchanged")
+        return {"status": "success", "message": "변경된 강의가 없어 업데이트를 건너뛰었습니다.", "lectures": lectures}
+
+    # 나머지 강의의 시간표를 동시에 조회하고, 끝나는 순서대로 저장
+    async for lec, schedule_data in catalog_client.lookup_many(to_fetch):
+        if isinstance(schedule_data, Exception):
+            logging.warning(f"[시간표 조회 실패] {lec['name']}: {schedule_data}")
+            emit("schedule", lecture=lec["full_name"], source="onestop", error=str(schedule_data))
+            continue
+        save_schedule_to_db(lec["code"], lec["section"], schedule_data, db)
+        lec["schedule"] = schedule_data
+        emit("schedule", lecture=lec["full_name"], source="onestop", schedule=schedule_data)
+
+    user.lecture_list_hash = list_hash
+    db.commit()
+    return {"status": "success", "message": "강의 및 시간표 업데이트 완료", "lectures": lectures}
+
+
+class SyncJob:
+    """강의 동기화 작업 하나. 진행 이벤트를 쌓아두고, 구독자는 처음부터 이어서 받는다."""
+
+    def __init__(self, user_id, force=False):
+        self.id = uuid.uuid4().hex
+        self.user_id = user_id
+        self.force = force
+        self.status = "pending"  # pending → running → success / failed
+        self.events = []
+        self.result = None
+        self.error = None
+        self.created_at = time.time()
+        self.finished_at = None
+        self._started = time.perf_counter()
+        self._changed = asyncio.Event()
+
+    @property
+    def done(self):
+        return self.status in ("success", "failed")
+
+    def emit(self, step, **data):
+        self.events.append({
+            "seq": len(self.events),
+            "step": step,
+            "elapsed_ms": round((time.perf_counter() - self._started) * 1000),
+            **data,
+        })
+        self._notify()
+
+    def finish(self, status, result=None, error=None):
+        self.status = status
+        self.result = result
+        self.error = error
+        self.finished_at = time.time()
+        self.emit(status, error=error)
+
+    def _notify(self):
+        # 기다리던 구독자를 모두 깨우고, 다음 대기를 위해 새 Event로 교체
+        changed, self._changed = self._changed, asyncio.Event()
+        changed.set()
+
+    async def follow(self):
+        """지금까지의 이벤트를 보내고, 작업이 끝날 때까지 새 이벤트를 이어서 내보낸다."""
+        sent = 0
+        while True:
+            changed = self._changed
+            while sent < len(self.events):
+                yield self.events[sent]
+                sent += 1
+            if self.done:
+                return
+            await changed.wait()
+
+    def to_dict(self):
+        return {
+            "job_id": self.id,
+            "status": self.status,
+            "created_at": self.created_at,
+            "finished_at": self.finished_at,
+            "events": self.events,
+            "result": self.result,
+            "error": self.error,
+        }
+
+
+class LectureSyncJobs:
+    """
+    강의 동기화를 요청과 분리해 백그라운드 작업으로 실행.
+    - 같은 사용자가 다시 요청하면 실행 중인 작업을 그대로 돌려줌 (중복 실행 방지)
+    - 끝난 작업은 retention초 동안 상태 조회/스트림 재생용으로 보관
+    """
+
+    def __init__(self, retention):
+        self.retention = retention
+        self._jobs = {}
+        self._running = {}  # user_id -> job_id
+        self._tasks = set()
+
+    def submit(self, user_id, force=False):
+        """(작업, 새로 만들었는지) 반환."""
+        self._prune()
+        job_id = self._running.get(user_id)
+        if job_id:
+            return self._jobs[job_id], False
+
+        job = SyncJob(user_id, force=force)
+        self._jobs[job.id] = job
+        self._running[user_id] = job.id
+        task = asyncio.create_task(self._run(job))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return job, True
+
+    def get(self, job_id):
+        return self._jobs.get(job_id)
+
+    async def shutdown(self):
+        for task in list(self._tasks):
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    async def _run(self, job):
+        job.status = "running"
+        job.emit("started")
+        db = SessionLocal()
+        try:
+            user = db.get(User, job.user_id)
+            result = await sync_user_lectures(user, db, job.emit, force=job.force)
+            job.finish("success", result=result)
+            logging.info(f"[강의 동기화 완료] user={job.user_id}, job={job.id}")
+        except Exception as e:
+            logging.error(f"[강의 업데이트 실패] user={job.user_id}, job={job.id}: {e}")
+            job.finish("failed", error=str(e))
+        finally:
+            if job.status == "running":
+                job.finish("failed", error="cancelled")  # 서버 종료로 취소됨
+            self._running.pop(job.user_id, None)
+            db.close()
+
+    def _prune(self):
+        now = time.time()
+        expired = [
+            job_id for job_id, job in self._jobs.items()
+            if job.done and now - job.finished_at > self.retention
+        ]
+        for job_id in expired:
+            del self._jobs[job_id]
+
+
+lecture_sync_jobs = LectureSyncJobs(retention=settings.LECTURE_SYNC_JOB_TTL)
@@ -0,0 +1,101 @@
+import logging
+
+from sqlalchemy import insert, select, tuple_, update
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+
+from models.lecture_location import LectureLocation
+from models.lecture_schedule import LectureSchedule
+from models.user_lecture_map import user_lecture
+from utils.chunking import chunks
+from utils.location_parser import parse_locations
+
+
+def _location_ids(db: Session, keys):
+    ids = {}
+    for chunk in chunks(keys):
+        rows = db.query(LectureLocation.id, LectureLocation.building_code, LectureLocation.room_number).filter(
+            tuple_(LectureLocation.building_code, LectureLocation.room_number).in_(chunk)
+        )
+        for location_id, code, room in rows:
+            ids[(code, room)] = location_id
+    return ids
+
+
+def _upsert_statement(db: Session, rows):
+    """(building_code, room_number) 유니크 제약에 걸리면 건너뛰는 다중 행 INSERT."""
+    dialect = db.get_bind().dialect.name
+    if dialect == "mysql":
+        # 다른 요청이 먼저 넣은 강의실은 그대로 둠 (no-op UPDATE)
+        return mysql_insert(LectureLocation).values(rows).on_duplicate_key_update(
+            building_code=LectureLocation.building_code
+        )
+    if dialect == "sqlite":
+        return sqlite_insert(LectureLocation).values(rows).on_conflict_do_nothing(
+            index_elements=["building_code", "room_number"]
+        )
+    return insert(LectureLocation).values(rows)
+
+
+def upsert_locations(db: Session, parsed_locations):
+    """
+    파싱된 오프라인 강의실들을 lecture_location에 반영하고 (building_code, room) → id 매핑 반환.
+    기존 강의실은 IN 조회 한 번, 없는 강의실은 upsert 한 번으로 추가한다. (커밋은 호출한 쪽에서)
+    반환: (매핑, 새로 추가한 수)
+    """
+    wanted = {}
+    for parsed in parsed_locations:
+        if parsed["type"] == "offline":
+            wanted.setdefault((parsed["building_code"], parsed["room"]), parsed)
+
+    ids = _location_ids(db, wanted)
+    missing = [
+        {
+            "building_code": code,
+            "room_number": room,
+            "building_name": parsed["building_name"],
+            "full_label": parsed["full_label"],
+        }
+        for (code, room), parsed in wanted.items()
+        if (code, room) not in ids
+    ]
+    if missing:
+        for chunk in chunks(missing):
+            db.execute(_upsert_statement(db, chunk))
+        ids.update(_location_ids(db, [(m["building_code"], m["room_number"]) for m in missing]))
+    return ids, len(missing)
+
+
+def resolve_schedule_locations(db: Session, user_id=None):
+    """
+    시간표의 강의실 문자열을 lecture_location에 연결 (user_id가 없으면 전체 시간표).
+    - 위치 문자열은 종류별로 한 번만 파싱
+    - 강의실 조회/추가는 upsert_locations의 IN 조회 + upsert 한 번
+    - lecture_location_id는 바뀐 시간표만 모아 한 번에 UPDATE, 커밋도 한 번
+    """
+    query = select(LectureSchedule.id, LectureSchedule.location, LectureSchedule.lecture_location_id)
+    if user_id is not None:
+        query = query.join(user_lecture, user_lecture.c.lecture_id == LectureSchedule.lecture_id).where(
+            user_lecture.c.user_id == user_id
+        )
+    schedules = db.execute(query.where(LectureSchedule.location.isnot(None))).all()
+
+    parsed = parse_locations(location for _, location, _ in schedules)
+    location_ids, inserted = upsert_locations(db, parsed.values())
+
+    changes = []
+    for schedule_id, location, current_id in schedules:
+        p = parsed[location]
+        if p["type"] != "offline":
+            continue
+        location_id = location_ids.get((p["building_code"], p["room"]))
+        if location_id and location_id != current_id:
+            changes.append({"id": schedule_id, "lecture_location_id": location_id})
+    if changes:
+        db.execute(update(LectureSchedule), changes)
+    db.commit()
+
+    stats = {"schedules": len(schedules), "new_locations": inserted, "updated_schedules": len(changes)}
+    logging.info(f"[강의실 위치 연결] user={user_id if user_id is not None else '전체'}, {stats}")
+    return stats
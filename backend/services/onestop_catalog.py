@@ -0,0 +1,164 @@
+import asyncio
+import logging
+
+from config.config import settings
+from utils.browser_pool import browser_pool
+from utils.page_ready import goto, ONESTOP_CATALOG
+from utils.schedule_parser import parse_schedule, parse_catalog_rows
+
+ONESTOP_CATALOG_URL = "https://onestop.pusan.ac.kr/page?menuCD=000000000000335"
+
+# 브라우저 풀에서 onestop 조회용으로 공유하는 컨텍스트 키
+ONESTOP_POOL_KEY = "onestop"
+
+# 강좌조회 화면의 검색 조건. 화면 구성이 바뀌면 여기만 고치면 됨
+TERM_SELECT = '.select-pure__select'
+TERM_OPTION = '.select-pure__option[data-value="0001"]'
+SEARCH_BY_NAME = 'input#SEARCH_GBN2'  # 검색 구분: 교과목명 (학기 전체 수집용)
+SUBJECT_NAME_INPUT = '#SCH_SUBJ_NM'
+SEARCH_BY_CODE = 'input#SEARCH_GBN1'  # 검색 구분: 교과목번호
+SUBJECT_CODE_INPUT = '#SCH_SUBJ_CD'
+SEARCH_BUTTON = 'button:has-text("조회")'
+
+
+class OnestopCatalogClient:
+    """
+    onestop 강의 시간표 조회 클라이언트.
+    - 브라우저 풀의 공유 "onestop" 컨텍스트 하나만 사용 (강의마다 브라우저를 띄우지 않음)
+    - 조회 화면을 미리 열어 둔 탭을 최대 max_pages개까지 재사용
+    - 여러 강의 조회를 세마포어로 제한하며 동시에 실행
+    - 교과목번호로 조회하므로 결과는 그 과목의 분반들뿐이고, 첫 페이지의 결과 테이블만 읽는다
+    """
+
+    def __init__(self, max_pages):
+        self.max_pages = max_pages
+        self._semaphore = asyncio.Semaphore(max_pages)
+        self._idle_pages = []
+
+    async def lookup(self, course_code, section_number, subject_name=None):
+        """해당 분반의 시간표 블록 목록. 조회 결과에 분반이 없으면 LookupError. (subject_name은 로그용)"""
+        async with self._semaphore:
+            async with browser_pool.lease(ONESTOP_POOL_KEY, pinned=True, accept_downloads=True) as context:
+                page = await self._take_page(context)
+                try:
+                    schedules = await _search_schedule(page, course_code, section_number)
+                except Exception:
+                    # 상태를 알 수 없는 탭은 재사용하지 않음
+                    await page.close()
+                    raise
+                self._idle_pages.append(page)
+
+        if schedules is None:
+            # 빈 시간표로 저장하면 '시간표 없는 강의'로 캐시되므로 실패로 돌려줌
+            raise LookupError(f"onestop 조회 결과에 분반이 없음: {subject_name or ''} {course_code}-{section_number}")
+        return schedules
+
+    async def lookup_many(self, lectures):
+        """
+        lectures(dict 목록: code/section/name)를 동시에 조회하고, 끝나는 순서대로
+        (lecture, 결과) 를 내보낸다. 실패한 조회는 결과 자리에 예외 객체가 들어간다.
+        """
+        async def run(lec):
+            try:
+                return lec, await self.lookup(lec["code"], lec["section"], lec["name"])
+            except Exception as e:
+                return lec, e
+
+        for next_done in asyncio.as_completed([run(lec) for lec in lectures]):
+            yield await next_done
+
+    async def close(self):
+        pages, self._idle_pages = self._idle_pages, []
+        for page in pages:
+            if not page.is_closed():
+                await page.close()
+
+    async def _take_page(self, context):
+        while self._idle_pages:
+            page = self._idle_pages.pop()
+            if not page.is_closed() and page.context is context:
+                return page
+        page = await context.new_page()
+        try:
+            await goto(page, ONESTOP_CATALOG_URL, ONESTOP_CATALOG)
+        except Exception:
+            # 조회 화면을 못 연 탭이 공유 컨텍스트에 계속 남지 않도록 닫음
+            await page.close()
+            raise
+        return page
+
+
+async def _search_schedule(page, course_code, section_number):
+    """
+    탭에서 교과목번호로 조회해 해당 분반의 시간표를 찾음. 분반 행이 없으면 None.
+    한 과목의 분반은 결과 첫 페이지에 모두 들어오므로 다음 페이지로 넘기지 않고,
+    페이지 전체 대신 결과 테이블(#resultTbody)만 꺼내 파싱한다.
+    """
+    # 재사용한 탭에 이전 검색 결과가 남아 있으면 아래 대기 조건이 바로 통과되므로 비워둠
+    await page.evaluate("() => { const t = document.querySelector('#resultTbody'); if (t) t.innerHTML = ''; }")
+
+    await page.click(TERM_SELECT)
+    await page.click(TERM_OPTION)
+    await page.click(SEARCH_BY_CODE)
+    await page.fill(SUBJECT_CODE_INPUT, course_code)
+    await page.click(SEARCH_BUTTON)
+
+    # 결과 행(결과 없음 안내 행 포함)이 붙을 때까지 대기
+    await page.wait_for_selector("#resultTbody > tr", state="attached", timeout=10000)
+    html = await page.eval_on_selector("#resultTbody", "t => t.outerHTML")
+    return parse_schedule(html, course_code, section_number)
+
+
+async def crawl_catalog(max_pages=1000):
+    """
+    학기 전체 강좌 목록을 처음부터 끝까지 넘기며 모든 행을 수집 (오프라인 수집 스크립트용).
+    교과목명 없이 조회한 뒤, 다음 페이지로 넘겨도 결과가 바뀌지 않을 때까지 반복한다.
+    """
+    rows = []
+    async with browser_pool.lease(ONESTOP_POOL_KEY, pinned=True) as context:
+        page = await context.new_page()
+        try:
+            await goto(page, ONESTOP_CATALOG_URL, ONESTOP_CATALOG)
+            await page.click(TERM_SELECT)
+            await page.click(TERM_OPTION)
+            await page.click(SEARCH_BY_NAME)
+            await page.fill(SUBJECT_NAME_INPUT, "")
+            await page.click(SEARCH_BUTTON)
+            await page.wait_for_function(
+                "document.querySelectorAll('#resultTbody > tr').length >= 1", timeout=30000
+            )
+
+            page_count = 1
+            while True:
+                page_rows = parse_catalog_rows(await page.content())
+                rows.extend(page_rows)
+                logging.info(f"[강좌 전체 수집] {page_count} 페이지, {len(page_rows)}행 (누적 {len(rows)})")
+
+                if page_count >= max_pages:
+                    logging.warning(f"⚠️ 페이지 수집 최대 횟수({max_pages}) 도달. 중단.")
+                    break
+                if not await _next_result_page(page):
+                    break
+                page_count += 1
+        finally:
+            await page.close()
+    return rows
+
+
+async def _next_result_page(page):
+    """다음 페이지로 넘김. 첫 행이 바뀌지 않으면 마지막 페이지로 보고 False."""
+    first_row = await page.eval_on_selector("#resultTbody > tr", "tr => tr.innerText")
+    await page.click("#resultTbody_Next")
+    try:
+        await page.wait_for_function(
+            "prev => { const tr = document.querySelector('#resultTbody > tr'); return tr && tr.innerText !== prev; }",
+            arg=first_row,
+            timeout=10000,
+        )
+    except Exception:
+        logging.debug("🚫 다음 페이지 결과가 바뀌지 않음 → 마지막 페이지로 판단")
+        return False
+    return True
+
+
+catalog_client = OnestopCatalogClient(max_pages=settings.ONESTOP_MAX_PAGES)
@@ -0,0 +1,267 @@
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+
+from playwright.async_api import async_playwright
+
+from config.config import settings
+from utils.lean_page import lean_page_profile
+from utils.single_flight import SingleFlight
+
+
+class _PooledContext:
+    """풀에서 관리하는 BrowserContext 한 개와 사용 상태."""
+
+    def __init__(self, key, context, pinned=False):
+        self.key = key
+        self.context = context
+        self.pinned = pinned
+        self.leases = 0
+        self.last_used = time.monotonic()
+        self.closed = False
+        self.discarded = False  # 풀에서 빠졌고, 마지막 lease가 반납되면 닫힘
+        context.on("close", lambda _: self._mark_closed())
+
+    def _mark_closed(self):
+        self.closed = True
+
+
+class BrowserPool:
+    """
+    프로세스 전체가 공유하는 Chromium 한 개와 사용자별 BrowserContext 풀.
+    - 컨텍스트는 key(보통 학번)별로 하나씩 유지되어 쿠키가 섞이지 않음
+    - 최대 max_contexts개까지 유지하며, 가득 차면 유휴 컨텍스트를 LRU 순서로 정리
+      (pinned 컨텍스트는 여러 사용자가 공유하는 용도라 개수 제한/정리 대상에서 제외)
+    - 주기적으로 브라우저 연결 상태를 확인하고 끊어졌으면 다시 띄움
+    """
+
+    def __init__(self, max_contexts, idle_ttl, health_interval, headless=True, context_setup=None):
+        self.max_contexts = max_contexts
+        self.idle_ttl = idle_ttl
+        self.health_interval = health_interval
+        self.headless = headless
+        # 새 컨텍스트마다 실행할 초기화 함수 (리소스 차단 라우팅 등)
+        self.context_setup = context_setup
+
+        self._playwright = None
+        self._browser = None
+        self._entries = OrderedDict()
+        # 잠금 밖에서 컨텍스트를 만드는 중인 key → pinned 여부 (자리를 미리 잡아 둠)
+        self._creating = {}
+        # 브라우저를 다시 띄울 때마다 증가. 재시작 전에 잡은 자리로 만든 컨텍스트는 등록하지 않음
+        self._generation = 0
+        self._cond = asyncio.Condition()
+        self._launch_flight = SingleFlight()
+        self._health_task = None
+
+    async def start(self):
+        await self._ensure_browser()
+        if self._health_task is None:
+            self._health_task = asyncio.create_task(self._health_loop())
+        logging.info(f"[브라우저 풀 시작] max_contexts={self.max_contexts}")
+
+    async def stop(self):
+        if self._health_task:
+            self._health_task.cancel()
+            self._health_task = None
+        async with self._cond:
+            for entry in list(self._entries.values()):
+                await self._close_entry(entry)
+            self._entries.clear()
+            if self._browser:
+                await self._browser.close()
+                self._browser = None
+            if self._playwright:
+                await self._playwright.stop()
+                self._playwright = None
+            self._cond.notify_all()
+        logging.info("[브라우저 풀 종료]")
+
+    @asynccontextmanager
+    async def lease(self, key, pinned=False, **context_options):
+        """
+        key에 해당하는 컨텍스트를 빌려준다. 없으면 context_options로 새로 만든다.
+        블록이 끝나면 컨텍스트는 닫히지 않고 풀로 돌아간다.
+        """
+        entry = await self._acquire(key, pinned, context_options)
+        try:
+            yield entry.context
+        finally:
+            async with self._cond:
+                entry.leases -= 1
+                entry.last_used = time.monotonic()
+                if entry.discarded and entry.leases == 0:
+                    await self._close_entry(entry)
+                self._cond.notify_all()
+
+    async def discard(self, key):
+        """
+        key의 컨텍스트를 풀에서 제거한다. (로그인 실패 등으로 상태가 꼬였을 때)
+        다음 lease부터는 새 컨텍스트를 받고, 아직 빌려 쓰는 요청이 있으면 모두 반납된 뒤에 닫는다.
+        """
+        async with self._cond:
+            entry = self._entries.pop(key, None)
+            if entry:
+                entry.discarded = True
+                if entry.leases == 0:
+                    await self._close_entry(entry)
+                logging.debug(f"[브라우저 풀 컨텍스트 제거] key={key}")
+            self._cond.notify_all()
+
+    def stats(self):
+        return {
+            "browser_connected": bool(self._browser and self._browser.is_connected()),
+            "contexts": self._user_context_count(),
+            "leased": sum(1 for e in self._entries.values() if e.leases),
+            "max_contexts": self.max_contexts,
+        }
+
+    async def _acquire(self, key, pinned, context_options):
+        # 잠금 안에서는 재사용할 컨텍스트를 찾거나 새로 만들 자리만 잡고,
+        # 시간이 걸리는 브라우저 실행/컨텍스트 생성/초기화는 잠금 밖에서 해서 다른 lease를 막지 않음
+        while True:
+            browser = await self._ensure_browser()
+            async with self._cond:
+                if browser is not self._browser:
+                    continue  # 그 사이 브라우저가 다시 떴으면 새 브라우저로 다시 시도
+
+                entry = self._entries.get(key)
+                if entry and entry.closed:
+                    del self._entries[key]
+                    entry = None
+                if entry:
+                    self._entries.move_to_end(key)
+                    entry.leases += 1
+                    entry.last_used = time.monotonic()
+                    return entry
+
+                if key in self._creating:
+                    # 같은 key의 컨텍스트를 다른 요청이 만드는 중이면 끝날 때까지 대기
+                    await self._cond.wait()
+                    continue
+
+                if not pinned and self._user_context_count() >= self.max_contexts and not await self._evict_lru():
+                    # 모든 컨텍스트가 사용 중이면 반납될 때까지 대기
+                    logging.debug(f"[브라우저 풀 대기] key={key}")
+                    await self._cond.wait()
+                    continue
+
+                self._creating[key] = pinned
+                generation = self._generation
+                break
+
+        try:
+            context = await browser.new_context(**context_options)
+            try:
+                if self.context_setup:
+                    await self.context_setup(context)
+            except BaseException:
+                await context.close()
+                raise
+        except BaseException:
+            async with self._cond:
+                if generation == self._generation:
+                    del self._creating[key]
+                self._cond.notify_all()
+            raise
+
+        async with self._cond:
+            if generation != self._generation:
+                # 만드는 도중 브라우저가 재시작됨 (자리는 재시작 때 이미 비워짐)
+                self._cond.notify_all()
+                restarted = True
+            else:
+                restarted = False
+                del self._creating[key]
+                entry = _PooledContext(key, context, pinned)
+                entry.leases = 1
+                self._entries[key] = entry
+                self._cond.notify_all()
+        if restarted:
+            await context.close()
+            raise RuntimeError(f"브라우저 재시작으로 컨텍스트 생성 취소: key={key}")
+        logging.debug(f"[브라우저 풀 컨텍스트 생성] key={key}, 총 {len(self._entries)}개")
+        return entry
+
+    def _user_context_count(self):
+        """pinned가 아닌 컨텍스트 수 (만드는 중인 것 포함)"""
+        return (
+            sum(1 for e in self._entries.values() if not e.pinned)
+            + sum(1 for pinned in self._creating.values() if not pinned)
+        )
+
+    async def _evict_lru(self):
+        for key, entry in self._entries.items():
+            if entry.leases == 0 and not entry.pinned:
+                del self._entries[key]
+                await self._close_entry(entry)
+                logging.debug(f"[브라우저 풀 LRU 정리] key={key}")
+                return True
+        return False
+
+    async def _ensure_browser(self):
+        """연결된 브라우저를 반환. 없거나 끊겼으면 띄운다 (잠금 밖에서, 동시에 불려도 한 번만)."""
+        browser = self._browser
+        if browser and browser.is_connected():
+            return browser
+        browser, _ = await self._launch_flight.do("chromium", self._launch)
+        return browser
+
+    async def _launch(self):
+        async with self._cond:
+            if self._browser and self._browser.is_connected():
+                return self._browser
+            if self._browser:
+                logging.warning("[브라우저 풀] 브라우저 연결 끊김 → 재시작")
+                # 끊긴 브라우저의 컨텍스트와, 그 브라우저로 만들던 자리를 함께 비움
+                self._entries.clear()
+                self._creating.clear()
+                self._generation += 1
+                self._browser = None
+                self._cond.notify_all()
+
+        if self._playwright is None:
+            self._playwright = await async_playwright().start()
+        browser = await self._playwright.chromium.launch(headless=self.headless)
+
+        async with self._cond:
+            self._browser = browser
+            self._cond.notify_all()
+        logging.info("[브라우저 풀] Chromium 시작 완료")
+        return browser
+
+    async def _close_entry(self, entry):
+        if entry.closed:
+            return
+        try:
+            await entry.context.close()
+        except Exception as e:
+            logging.warning(f"[브라우저 풀 컨텍스트 종료 실패] key={entry.key}, {e}")
+        entry.closed = True
+
+    async def _health_loop(self):
+        while True:
+            await asyncio.sleep(self.health_interval)
+            try:
+                await self._ensure_browser()
+                async with self._cond:
+                    now = time.monotonic()
+                    for key, entry in list(self._entries.items()):
+                        idle = entry.leases == 0 and not entry.pinned and now - entry.last_used > self.idle_ttl
+                        if entry.closed or idle:
+                            del self._entries[key]
+                            await self._close_entry(entry)
+                            logging.debug(f"[브라우저 풀 유휴 정리] key={key}")
+                    self._cond.notify_all()
+            except Exception as e:
+                logging.error(f"[브라우저 풀 헬스체크 실패] {e}")
+
+
+browser_pool = BrowserPool(
+    max_contexts=settings.BROWSER_POOL_MAX_CONTEXTS,
+    idle_ttl=settings.BROWSER_POOL_IDLE_TTL,
+    health_interval=settings.BROWSER_POOL_HEALTH_INTERVAL,
+    context_setup=lean_page_profile.apply,
+)
@@ -0,0 +1,9 @@
+# IN 절 하나(또는 다중 행 INSERT 한 번)에 넣을 최대 개수
+CHUNK_SIZE = 500
+
+
+def chunks(items, size=CHUNK_SIZE):
+    """items를 size개씩 나눈 리스트를 차례로 반환."""
+    items = list(items)
+    for i in range(0, len(items), size):
+        yield items[i:i + size]
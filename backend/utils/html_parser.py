@@ -0,0 +1,57 @@
+import logging
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from bs4 import BeautifulSoup
+
+from config.config import settings
+
+try:
+    import lxml  # noqa: F401  (BeautifulSoup의 "lxml" 트리 빌더가 사용)
+    HAS_LXML = True
+except ImportError:
+    HAS_LXML = False
+
+BACKENDS = ("lxml", "html.parser")
+
+# parity 검사 등에서 설정값 대신 쓸 (backend, strain) 임시 지정
+_override = ContextVar("html_parser_override", default=None)
+_warned = False
+
+
+def _backend_and_strain():
+    override = _override.get()
+    if override is not None:
+        return override
+    return settings.HTML_PARSER_BACKEND, settings.HTML_PARSER_STRAIN
+
+
+def _resolve(backend):
+    global _warned
+    if backend == "lxml" and not HAS_LXML:
+        if not _warned:
+            logging.warning("[HTML 파서] lxml이 설치되지 않아 html.parser로 대체")
+            _warned = True
+        return "html.parser"
+    return backend
+
+
+def make_soup(html, only=None):
+    """
+    스크래핑용 BeautifulSoup 생성. 모든 파싱 경로는 이 함수를 거친다.
+    - 파서 백엔드는 HTML_PARSER_BACKEND ("lxml" 기본, 없으면 "html.parser")
+    - only(SoupStrainer)를 주면 해당 요소만 트리로 만들어 큰 페이지에서 시간/메모리를 줄임
+      (HTML_PARSER_STRAIN=False로 끄면 항상 전체 트리)
+    """
+    backend, strain = _backend_and_strain()
+    return BeautifulSoup(html, _resolve(backend), parse_only=only if strain else None)
+
+
+@contextmanager
+def parser_override(backend, strain=True):
+    """with 블록 안에서만 파서 백엔드/SoupStrainer 사용 여부를 바꿈 (A/B 비교용)."""
+    token = _override.set((backend, strain))
+    try:
+        yield
+    finally:
+        _override.reset(token)
@@ -0,0 +1,96 @@
+from collections import Counter
+from urllib.parse import urlparse
+
+from config.config import settings
+
+
+class LeanPageProfile:
+    """
+    Playwright 컨텍스트에 context.route()로 붙이는 리소스 차단 프로필.
+    스크래핑에 필요 없는 이미지/폰트/분석 스크립트 등을 사이트(호스트)별 규칙에 따라 막는다.
+
+    rules 형식 (호스트별, 매칭되는 호스트가 없으면 "*" 규칙 사용):
+        {
+            "plato.pusan.ac.kr": {
+                "block_types": ["image", "font", "media"],  # 막을 resource_type
+                "deny": ["/theme/image.php"],                # URL에 포함되면 무조건 차단
+                "allow": ["/lib/javascript.php"],            # URL에 포함되면 무조건 허용 (deny보다 우선)
+            },
+            "*": {...}
+        }
+    """
+
+    def __init__(self, rules, enabled=True):
+        self.rules = rules
+        self.enabled = enabled
+        self.blocked_requests = Counter()  # (host, resource_type) -> 차단 수
+        self.allowed_requests = 0
+        self.loaded_bytes = 0
+        # 차단된 요청은 크기를 알 수 없으므로, 허용된 응답에서 본 resource_type별 평균 크기로 추정
+        self._seen_bytes = Counter()
+        self._seen_count = Counter()
+        self._blocked_bytes_est = 0
+
+    async def apply(self, context):
+        if not self.enabled:
+            return
+        await context.route("**/*", self._handle)
+        context.on("response", self._on_response)
+
+    async def _handle(self, route):
+        request = route.request
+        host = urlparse(request.url).hostname or ""
+        if self._should_block(host, request.url, request.resource_type):
+            self.blocked_requests[(host, request.resource_type)] += 1
+            self._blocked_bytes_est += self._average_size(request.resource_type)
+            await route.abort("blockedbyclient")
+            return
+        self.allowed_requests += 1
+        await route.continue_()
+
+    def _should_block(self, host, url, resource_type):
+        rule = self._rule_for(host)
+        if any(pattern in url for pattern in rule.get("allow", [])):
+            return False
+        if any(pattern in url for pattern in rule.get("deny", [])):
+            return True
+        return resource_type in rule.get("block_types", [])
+
+    def _rule_for(self, host):
+        if host in self.rules:
+            return self.rules[host]
+        # 서브도메인은 상위 도메인 규칙을 따름 (예: cdn.plato.pusan.ac.kr)
+        for site, rule in self.rules.items():
+            if site != "*" and host.endswith("." + site):
+                return rule
+        return self.rules.get("*", {})
+
+    def _on_response(self, response):
+        try:
+            size = int(response.headers.get("content-length", 0))
+        except ValueError:
+            return
+        resource_type = response.request.resource_type
+        self.loaded_bytes += size
+        self._seen_bytes[resource_type] += size
+        self._seen_count[resource_type] += 1
+
+    def _average_size(self, resource_type):
+        count = self._seen_count[resource_type]
+        return self._seen_bytes[resource_type] // count if count else 0
+
+    def stats(self):
+        by_site = {}
+        for (host, resource_type), count in self.blocked_requests.items():
+            by_site.setdefault(host, {})[resource_type] = count
+        return {
+            "enabled": self.enabled,
+            "blocked_requests": sum(self.blocked_requests.values()),
+            "blocked_bytes_estimate": self._blocked_bytes_est,
+            "allowed_requests": self.allowed_requests,
+            "loaded_bytes": self.loaded_bytes,
+            "blocked_by_site": by_site,
+        }
+
+
+lean_page_profile = LeanPageProfile(settings.LEAN_PAGE_RULES, enabled=settings.LEAN_PAGE_ENABLED)
@@ -0,0 +1,197 @@
+import asyncio
+import logging
+import time
+from collections import defaultdict
+
+from config.config import settings
+from database import SessionLocal
+from models.lecture_location import LectureLocation
+from utils.location_parser import CAMPUSES
+
+# 한글 음절의 초성 (유니코드 순서)
+CHOSEONG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+HANGUL_BASE = 0xAC00
+HANGUL_LAST = 0xD7A3
+
+
+def to_choseong(text):
+    """한글 음절은 초성으로 바꾸고 나머지 문자는 그대로 둠. (예: "공학관" → "ㄱㅎㄱ")"""
+    return "".join(
+        CHOSEONG[(ord(ch) - HANGUL_BASE) // 588] if HANGUL_BASE <= ord(ch) <= HANGUL_LAST else ch
+        for ch in text
+    )
+
+
+def _normalize(text):
+    return "".join(text.lower().split())
+
+
+def _ngrams(text):
+    """1-gram과 2-gram. 한 글자 질의는 1-gram, 그 이상은 2-gram 교집합으로 후보를 찾는다."""
+    grams = set(text)
+    grams.update(text[i:i + 2] for i in range(len(text) - 1))
+    return grams
+
+
+class _Snapshot:
+    """한 시점의 색인. 만든 뒤에는 바꾸지 않으므로 여러 요청이 잠금 없이 동시에 읽어도 됨."""
+
+    __slots__ = ("entries", "keys", "postings", "room_count")
+
+    def __init__(self, entries, keys, postings, room_count):
+        self.entries = entries      # 검색 결과로 돌려줄 항목 (tuple)
+        self.keys = keys            # entry별 검색 대상 문자열 목록 (정규화/초성)
+        self.postings = postings    # n-gram → entry 위치 frozenset
+        self.room_count = room_count
+
+
+def _build_snapshot(rooms):
+    entries = []
+    for campus, buildings in CAMPUSES.items():
+        for code, name in buildings.items():
+            entries.append({
+                "type": "building",
+                "campus": campus,
+                "building_code": code,
+                "building_name": name,
+                "room": None,
+                "label": name,
+            })
+    building_campus = {e["building_code"]: e["campus"] for e in entries}
+    for code, room, name in rooms:
+        if not code or not room:
+            continue
+        entries.append({
+            "type": "room",
+            "campus": building_campus.get(code),
+            "building_code": code,
+            "building_name": name,
+            "room": room,
+            "label": f"{name or code} {room}호",
+        })
+
+    keys = []
+    postings = defaultdict(set)
+    for idx, entry in enumerate(entries):
+        texts = {entry["building_code"], entry["building_name"] or "", entry["label"]}
+        if entry["room"]:
+            texts.add(f"{entry['building_code']}-{entry['room']}")
+        entry_keys = set()
+        for text in texts:
+            norm = _normalize(text)
+            if norm:
+                entry_keys.add(norm)
+                entry_keys.add(to_choseong(norm))
+        keys.append(tuple(entry_keys))
+        for key in entry_keys:
+            for gram in _ngrams(key):
+                postings[gram].add(idx)
+
+    return _Snapshot(
+        tuple(entries),
+        tuple(keys),
+        {gram: frozenset(idxs) for gram, idxs in postings.items()},
+        len(entries) - len(building_campus),
+    )
+
+
+class LocationSearchIndex:
+    """
+    건물/강의실 자동완성용 메모리 색인.
+    - 건물: location_parser의 건물 레지스트리 (캠퍼스, 코드, 이름)
+    - 강의실: lecture_location 테이블에 저장된 (건물 코드, 호실)
+    - 이름/코드/라벨과 이름의 초성에 대해 n-gram 역색인을 만들어 두고,
+      후보를 교집합으로 좁힌 뒤 부분 문자열로 확인
+    - 서버 시작 시(start) 한 번, 이후 refresh_interval초마다 백그라운드에서 lecture_location을 다시 읽어
+      새 _Snapshot을 만들고 참조 하나만 바꿔 끼움 (검색 요청은 색인을 만들지 않음)
+    """
+
+    def __init__(self, refresh_interval):
+        self.refresh_interval = refresh_interval
+        # start 전에도 건물 검색은 되도록 건물만 담은 색인으로 시작
+        self._snapshot = _build_snapshot([])
+        self._refresh_task = None
+
+    async def start(self):
+        await asyncio.to_thread(self.refresh)
+        if self._refresh_task is None:
+            self._refresh_task = asyncio.create_task(self._refresh_loop())
+
+    async def stop(self):
+        if self._refresh_task:
+            self._refresh_task.cancel()
+            self._refresh_task = None
+
+    def search(self, query, limit=10):
+        snapshot = self._snapshot  # 검색 도중 교체돼도 같은 색인을 끝까지 사용
+        q = _normalize(query)
+        if not q:
+            return []
+
+        grams = [q] if len(q) == 1 else [q[i:i + 2] for i in range(len(q) - 1)]
+        candidates = None
+        for gram in grams:
+            posting = snapshot.postings.get(gram)
+            if not posting:
+                return []
+            candidates = set(posting) if candidates is None else candidates & posting
+            if not candidates:
+                return []
+
+        scored = []
+        for idx in candidates:
+            rank = self._rank(snapshot.keys[idx], q)
+            if rank is not None:
+                entry = snapshot.entries[idx]
+                scored.append((rank, entry["type"] != "building", len(entry["label"]), entry["label"], idx))
+        scored.sort()
+        return [dict(snapshot.entries[s[-1]]) for s in scored[:limit]]
+
+    @staticmethod
+    def _rank(keys, q):
+        """0: 코드/이름 완전 일치, 1: 접두어 일치, 2: 부분 일치, None: 불일치"""
+        best = None
+        for key in keys:
+            if key == q:
+                return 0
+            if key.startswith(q):
+                best = 1
+            elif best is None and q in key:
+                best = 2
+        return best
+
+    async def _refresh_loop(self):
+        while True:
+            await asyncio.sleep(self.refresh_interval)
+            await asyncio.to_thread(self.refresh)
+
+    def refresh(self):
+        """lecture_location을 다시 읽어 색인 교체. DB를 못 읽으면 기존 색인(또는 건물만) 유지."""
+        try:
+            rooms = self._load_rooms()
+        except Exception as e:
+            logging.warning(f"[위치 검색 색인] 강의실 목록 로드 실패: {e}")
+            return
+        self.rebuild(rooms)
+
+    @staticmethod
+    def _load_rooms():
+        db = SessionLocal()
+        try:
+            return db.query(
+                LectureLocation.building_code, LectureLocation.room_number, LectureLocation.building_name
+            ).all()
+        finally:
+            db.close()
+
+    def rebuild(self, rooms):
+        start = time.perf_counter()
+        snapshot = _build_snapshot(rooms)
+        self._snapshot = snapshot
+        logging.info(
+            f"[위치 검색 색인] 항목 {len(snapshot.entries)}개 (강의실 {snapshot.room_count}개), "
+            f"{(time.perf_counter() - start) * 1000:.1f}ms"
+        )
+
+
+location_index = LocationSearchIndex(refresh_interval=settings.LOCATION_SEARCH_REFRESH)
@@ -0,0 +1,96 @@
+import logging
+import re
+import time
+from collections import defaultdict
+
+
+class Readiness:
+    """
+    페이지가 '다 뜬' 것으로 보는 조건. networkidle 대신 페이지별로 필요한 것만 기다린다.
+    - selector: 해당 요소가 DOM에 붙으면 준비 완료
+    - url: 현재 URL이 정규식과 일치하면 준비 완료
+    - response: URL이 정규식과 일치하는 응답(XHR 등)이 도착하면 준비 완료
+    - navigation: action이 일으킨 페이지 이동의 DOMContentLoaded까지 대기
+    아무 조건도 없으면 DOMContentLoaded만 기다린다.
+    """
+
+    def __init__(self, name, selector=None, url=None, response=None, navigation=False, timeout=10000):
+        self.name = name
+        self.selector = selector
+        self.url = re.compile(url) if url else None
+        self.response = re.compile(response) if response else None
+        self.navigation = navigation
+        self.timeout = timeout
+
+
+# 페이지별 준비 조건
+PLATO_LOGIN = Readiness(
+    "plato_login",
+    selector='button[title=""]:has-text("로그아웃"), input[name="username"]',
+)
+PLATO_LOGIN_SUBMIT = Readiness("plato_login_submit", navigation=True)
+PLATO_ATTENDANCE = Readiness("plato_attendance", url=r"(my_status|autoattendance)\.php")
+PLATO_ATTENDANCE_SUBMIT = Readiness("plato_attendance_submit", url=r"(user_action|my_status)\.php")
+ONESTOP_CATALOG = Readiness("onestop_catalog", selector=".select-pure__select")
+
+
+class NavigationTimings:
+    """단계(Readiness 이름)별 대기 시간 누적. 어떤 페이지가 지연을 주도하는지 확인용."""
+
+    def __init__(self):
+        self._stats = defaultdict(lambda: {"count": 0, "total_ms": 0.0, "max_ms": 0.0})
+
+    def record(self, name, elapsed_ms):
+        stat = self._stats[name]
+        stat["count"] += 1
+        stat["total_ms"] += elapsed_ms
+        stat["max_ms"] = max(stat["max_ms"], elapsed_ms)
+
+    def stats(self):
+        return {
+            name: {
+                "count": s["count"],
+                "avg_ms": round(s["total_ms"] / s["count"], 1),
+                "max_ms": round(s["max_ms"], 1),
+                "total_ms": round(s["total_ms"], 1),
+            }
+            for name, s in sorted(self._stats.items(), key=lambda kv: -kv[1]["total_ms"])
+        }
+
+
+navigation_timings = NavigationTimings()
+
+
+async def goto(page, url, ready):
+    """url로 이동한 뒤 ready 조건까지 기다린다."""
+    async def action():
+        await page.goto(url, wait_until="domcontentloaded", timeout=ready.timeout)
+    await wait_ready(page, ready, action)
+
+
+async def wait_ready(page, ready, action=None):
+    """
+    action(클릭, 이동 등)을 실행하고 ready 조건이 만족될 때까지 기다린다.
+    걸린 시간은 navigation_timings에 단계 이름으로 기록된다.
+    """
+    start = time.perf_counter()
+    try:
+        if ready.response:
+            async with page.expect_response(lambda r: ready.response.search(r.url), timeout=ready.timeout):
+                if action:
+                    await action()
+        elif ready.navigation:
+            async with page.expect_navigation(wait_until="domcontentloaded", timeout=ready.timeout):
+                if action:
+                    await action()
+        elif action:
+            await action()
+
+        if ready.url:
+            await page.wait_for_url(ready.url, wait_until="commit", timeout=ready.timeout)
+        if ready.selector:
+            await page.wait_for_selector(ready.selector, state="attached", timeout=ready.timeout)
+    finally:
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        navigation_timings.record(ready.name, elapsed_ms)
+        logging.debug(f"[페이지 준비] {ready.name} {elapsed_ms:.0f}ms")
@@ -1,26 +1,106 @@
 import os
 import json
+import time
+import asyncio
+import logging
 from cryptography.fernet import Fernet
+from sqlalchemy import update
+from sqlalchemy.exc import IntegrityError
+
+from config.config import settings
+from database import SessionLocal
+from models.plato_session import PlatoSession
 
-COOKIE_DIR = "cookies"
-os.makedirs(COOKIE_DIR, exist_ok=True)  # 이 줄 추가
 FERNET_KEY = os.environ["FERNET_KEY"]
 fernet = Fernet(FERNET_KEY)
 
+
+class CookieStore:
+    """
+    PLATO storage_state(쿠키) 저장소. API 서버와 자동 출석 runner가 함께 사용한다.
+    - 원본은 plato_sessions 테이블에 암호화해서 저장 (여러 uvicorn worker/프로세스가 공유)
+    - 복호화된 값은 프로세스 메모리에 ttl초 동안 캐시 → 재사용 시 dict 조회만 발생
+    - DB 입출력은 스레드로 넘겨 이벤트 루프를 막지 않음
+    """
+
+    def __init__(self, ttl):
+        self.ttl = ttl
+        self._cache = {}
+
+    async def load(self, student_id):
+        cached = self._cache.get(student_id)
+        if cached and time.monotonic() - cached[1] <= self.ttl:
+            return cached[0]
+
+        state = await asyncio.to_thread(self._read, student_id)
+        if state is not None:
+            self._cache[student_id] = (state, time.monotonic())
+        return state
+
+    async def save(self, student_id, state):
+        self._cache[student_id] = (state, time.monotonic())
+        encrypted = fernet.encrypt(json.dumps(state).encode()).decode()
+        await asyncio.to_thread(self._write, student_id, encrypted)
+
+    def invalidate(self, student_id):
+        self._cache.pop(student_id, None)
+
+    def _read(self, student_id):
+        db = SessionLocal()
+        try:
+            row = db.get(PlatoSession, student_id)
+            if row is None:
+                return None
+            try:
+                return json.loads(fernet.decrypt(row.storage_state_encrypted.encode()).decode())
+            except Exception as e:
+                logging.warning(f"[쿠키 복호화 실패] student_id={student_id}, {e}")
+                return None
+        finally:
+            db.close()
+
+    def _write(self, student_id, encrypted):
+        db = SessionLocal()
+        try:
+            result = db.execute(
+                update(PlatoSession)
+                .where(PlatoSession.student_id == student_id)
+                .values(storage_state_encrypted=encrypted)
+            )
+            if result.rowcount == 0:
+                db.add(PlatoSession(student_id=student_id, storage_state_encrypted=encrypted))
+            try:
+                db.commit()
+            except IntegrityError:
+                # 다른 worker가 동시에 먼저 INSERT한 경우 → UPDATE로 덮어씀
+                db.rollback()
+                db.execute(
+                    update(PlatoSession)
+                    .where(PlatoSession.student_id == student_id)
+                    .values(storage_state_encrypted=encrypted)
+                )
+                db.commit()
+        finally:
+            db.close()
+
+
+cookie_store = CookieStore(ttl=settings.COOKIE_CACHE_TTL)
+
+
 async def save_cookies(context, user_id):
-    path = os.path.join(COOKIE_DIR, f"cookies-{user_id}.json")
     raw_json = await context.storage_state()  # await is necessary here
-    encrypted = fernet.encrypt(json.dumps(raw_json).encode())
-    os.makedirs(os.path.dirname(path), exist_ok=True)
-    with open(path, 'wb') as f:
-        f.write(encrypted)
+    await cookie_store.save(user_id, raw_json)
+
+async def load_storage_state(user_id):
+    return await cookie_store.load(user_id)
 
 async def load_cookies_if_exist(browser, user_id):
-    path = os.path.join(COOKIE_DIR, f"cookies-{user_id}.json")
-    if os.path.exists(path):
-        with open(path, 'rb') as f:
-            encrypted = f.read()
-        decrypted = json.loads(fernet.decrypt(encrypted).decode())
-        context = await browser.new_context(storage_state=decrypted)
-        return context
-    return None
\ No newline at end of file
+    storage_state = await cookie_store.load(user_id)
+    if storage_state is None:
+        return None
+    try:
+        return await browser.new_context(storage_state=storage_state)
+    except Exception:
+        # storage_state 구조가 꼬였을 때
+        cookie_store.invalidate(user_id)
+        return None
@@ -0,0 +1,126 @@
+import logging
+from collections import OrderedDict
+
+import httpx
+
+from config.config import settings
+from utils.plato_cookie import load_storage_state
+from utils.plato_login import get_plato_session
+from utils.session_cache import session_cache
+
+USER_AGENT = (
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36"
+)
+
+# 로그인된 PLATO 페이지에만 있는 상단 사용자 메뉴의 로그아웃 링크 (plato_login의 로그아웃 버튼 확인과 같은 기준)
+LOGGED_IN_MARKER = "login/logout.php"
+
+
+class SessionExpired(Exception):
+    """저장된 쿠키로 요청했지만 PLATO가 login.php로 돌려보냈거나, 로그인되지 않은(손님) 페이지를 준 경우."""
+
+
+class PlatoHttpClient:
+    """
+    브라우저 없이 PLATO 페이지를 읽는 비동기 HTTP 클라이언트.
+    - 모든 사용자가 하나의 커넥션 풀(keep-alive)을 공유
+    - 쿠키는 학번별 httpx.AsyncClient에 따로 보관해 서로 섞이지 않음
+    - 쿠키가 만료됐을 때만 Playwright(get_plato_session)로 재로그인
+    """
+
+    def __init__(self, max_connections, timeout, max_clients=256):
+        self.max_connections = max_connections
+        self.timeout = timeout
+        self.max_clients = max_clients
+        self._transport = None
+        self._clients = OrderedDict()
+
+    async def aclose(self):
+        # 사용자별 클라이언트는 transport를 공유하므로 transport만 닫으면 됨
+        self._clients.clear()
+        if self._transport:
+            await self._transport.aclose()
+            self._transport = None
+
+    async def get_html(self, user, url):
+        """url의 HTML을 반환. 세션이 만료됐으면 브라우저로 재로그인 후 한 번 더 시도."""
+        student_id = user.student_id
+        try:
+            return await self._get(student_id, url)
+        except SessionExpired:
+            logging.info(f"[HTTP 세션 만료 → 브라우저 재로그인] student_id={student_id}")
+            session_cache.invalidate(student_id)
+
+        async with get_plato_session(user) as page:
+            cookies = await page.context.cookies()
+        self._set_cookies(student_id, cookies)
+        return await self._get(student_id, url)
+
+    async def _get(self, student_id, url):
+        client = await self._client_for(student_id)
+        if not client.cookies:
+            raise SessionExpired(url)
+
+        res = await client.get(url)
+        res.raise_for_status()
+        if "login.php" in str(res.url) or LOGGED_IN_MARKER not in res.text:
+            # 로그인 화면이나 손님 페이지를 그대로 파싱하지 않도록 만료로 처리하고,
+            # 다음 요청에서 같은 만료 쿠키를 다시 쓰지 않도록 버림
+            logging.warning(f"[HTTP 세션 만료 감지] {res.url}")
+            self._clients.pop(student_id, None)
+            raise SessionExpired(url)
+
+        session_cache.mark_valid(student_id)
+        logging.debug(f"[HTTP 조회 성공] {res.url}")
+        return res.text
+
+    async def _client_for(self, student_id):
+        client = self._clients.get(student_id)
+        if client is not None:
+            self._clients.move_to_end(student_id)
+            return client
+
+        client = self._new_client()
+        state = await load_storage_state(student_id)
+        if state:
+            self._fill_jar(client, state.get("cookies", []))
+        self._remember(student_id, client)
+        return client
+
+    def _set_cookies(self, student_id, cookies):
+        client = self._new_client()
+        self._fill_jar(client, cookies)
+        self._remember(student_id, client)
+
+    def _remember(self, student_id, client):
+        self._clients[student_id] = client
+        self._clients.move_to_end(student_id)
+        while len(self._clients) > self.max_clients:
+            self._clients.popitem(last=False)
+
+    def _new_client(self):
+        if self._transport is None:
+            self._transport = httpx.AsyncHTTPTransport(
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_connections,
+                ),
+            )
+        return httpx.AsyncClient(
+            transport=self._transport,
+            timeout=self.timeout,
+            follow_redirects=True,
+            headers={"User-Agent": USER_AGENT},
+        )
+
+    @staticmethod
+    def _fill_jar(client, cookies):
+        for c in cookies:
+            client.cookies.set(c["name"], c["value"], domain=c.get("domain", ""), path=c.get("path", "/"))
+
+
+plato_http = PlatoHttpClient(
+    max_connections=settings.PLATO_HTTP_MAX_CONNECTIONS,
+    timeout=settings.PLATO_HTTP_TIMEOUT,
+)
@@ -1,68 +1,145 @@
-from utils.plato_cookie import load_cookies_if_exist, save_cookies
+from contextlib import asynccontextmanager
+
+from utils.browser_pool import browser_pool
+from utils.plato_cookie import load_storage_state, save_cookies
+from utils.session_cache import session_cache
+from utils.single_flight import SingleFlight
 from utils.auth_helper import decrypt
+from utils.page_ready import goto, wait_ready, PLATO_LOGIN, PLATO_LOGIN_SUBMIT
 import logging
 
-async def get_plato_session(p, user):
+PLATO_URL = "https://plato.pusan.ac.kr"
+PLATO_LOGIN_URL = "https://plato.pusan.ac.kr/login.php"
+
+# 학번별 진행 중인 로그인
+login_flight = SingleFlight()
+
+
+class _LoginRedirect(Exception):
+    """목적 페이지 대신 login.php로 이동됨 (세션 만료)"""
+
+
+@asynccontextmanager
+async def get_plato_session(user, url=None, ready=None):
+    """
+    브라우저 풀에서 user 전용 컨텍스트를 빌려, PLATO에 로그인된 page를 넘겨준다.
+    - url을 주면 그 페이지로 바로 이동해 ready 조건까지 기다린 page를 넘겨준다
+    - url이 없으면 이동하지 않은 page를 넘겨준다 (쿠키만 필요한 경우)
+    사용 예: async with get_plato_session(user, attendance_url, PLATO_ATTENDANCE) as page: ...
+    블록이 끝나면 page만 닫히고 컨텍스트(쿠키)는 풀에 남아 다음 요청에서 재사용된다.
+    """
     student_id = user.student_id
-    student_pw = decrypt(user.student_password_encrypted)
     # 디버깅용 상세 추적은 debug, 주요 이벤트는 info
     logging.debug(f"[get_plato_session 진입] student_id={student_id}")
 
-    logging.debug("[브라우저 시작 시도 중]")
-    browser = await p.chromium.launch(headless=True)
-    logging.info("[브라우저 시작 성공]")
+    # 저장된 쿠키는 풀에 컨텍스트가 없어서 새로 만들 때만 사용됨 (메모리 캐시 조회라 비용이 거의 없음)
+    storage_state = await load_storage_state(student_id)
+    async with browser_pool.lease(student_id, storage_state=storage_state) as context:
+        page = await context.new_page()
+        # 이후 어느 요청에서든 login.php로 튕기면 세션 캐시를 비움
+        session_cache.watch(page, student_id)
+        try:
+            try:
+                await _ensure_logged_in(page, user, url, ready)
+            except Exception as e:
+                logging.exception(f"[세션 생성 실패] {e}")
+                # 상태를 알 수 없는 컨텍스트는 다음 요청에서 재사용하지 않음
+                await browser_pool.discard(student_id)
+                raise
+            yield page
+        finally:
+            await page.close()
+
+
+async def _ensure_logged_in(page, user, url, ready):
+    student_id = user.student_id
+    context = page.context
+
+    # 0. 최근에 확인된 세션이면 login.php 확인 없이 목적 페이지로 바로 이동
+    if session_cache.is_valid(student_id) and await context.cookies(PLATO_URL):
+        if url is None:
+            logging.debug("[세션 캐시 적중: 로그인 확인 생략]")
+            return
+        if await _goto_if_logged_in(page, url, ready):
+            logging.debug("[세션 캐시 적중: 로그인 확인 생략]")
+            return
+        logging.warning("[세션 캐시 적중했으나 로그인 페이지로 이동됨 → 재확인]")
+
+    # 같은 학번으로 동시에 들어온 요청은 로그인을 한 번만 수행하고 결과(쿠키)를 공유함
+    cookies, shared = await login_flight.do(student_id, lambda: _login_once(user))
+    if shared:
+        logging.debug("[진행 중인 로그인 결과 공유]")
+    # 보통 같은 컨텍스트라 이미 들어 있지만, 그 사이 컨텍스트가 새로 만들어졌어도 로그인 상태가 되도록 반영
+    await context.add_cookies(cookies)
+    if url is not None and not await _goto_if_logged_in(page, url, ready):
+        raise Exception(f"로그인 후에도 로그인 페이지로 이동됨: {url}")
+
+
+async def _goto_if_logged_in(page, url, ready):
+    """url로 이동해 ready 조건까지 기다린다. login.php로 튕기면 조건을 기다리지 않고 False."""
+    async def action():
+        await page.goto(url, wait_until="domcontentloaded", timeout=ready.timeout)
+        if "login.php" in page.url:
+            raise _LoginRedirect(url)
 
     try:
-        # 1️. 쿠키로 우선 시도
-        context = await load_cookies_if_exist(browser, student_id)
-        if context:
-            logging.debug("[쿠키 기반 로그인 시도]")
-            page = await context.new_page()
-            await page.goto("https://plato.pusan.ac.kr/login.php")
-            await page.wait_for_load_state("networkidle")
-
-            logout_button = await page.query_selector('button[title=""]:has-text("로그아웃")')
-            if logout_button:
-                logging.info("[쿠키 로그인 성공 (로그아웃 버튼 감지됨)]")
-                await page.goto("https://plato.pusan.ac.kr")
-                return browser, page
-            else:
-                logging.warning("[쿠키 로그인 실패: 로그아웃 버튼 없음]")
-                await context.close()  # 쿠키 context 명시적 종료
-
-        # 2. 실패 시 로그인
-        context = await browser.new_context()
-        logging.info("[🔐 수동 로그인 시도]")
+        await wait_ready(page, ready, action)
+        return True
+    except _LoginRedirect:
+        return False
+
+
+async def _login_once(user):
+    """
+    로그인 전용 lease와 page를 따로 잡고 로그인한 뒤 쿠키를 돌려준다.
+    처음 요청한 쪽이 취소되거나 page를 닫아도, 같은 로그인을 기다리는 다른 요청은 영향을 받지 않는다.
+    """
+    student_id = user.student_id
+    storage_state = await load_storage_state(student_id)
+    async with browser_pool.lease(student_id, storage_state=storage_state) as context:
         page = await context.new_page()
-        await page.goto("https://plato.pusan.ac.kr/login.php")
-        logging.debug("[학번 입력 시도]")
-        await page.fill('input[name="username"]', student_id)
-        logging.debug("[비밀번호 입력 시도]")
-        await page.fill('input[name="password"]', student_pw)
-        logging.debug("[로그인 버튼 클릭]")
-        await page.click('[name="loginbutton"]')
-        logging.debug("[로드 대기]")
-        await page.wait_for_load_state("networkidle")
-
-        # 3. 로그인 실패 확인
-        if "login.php" in page.url or await page.query_selector("div.loginerrors"):
-            raise Exception("로그인 실패: 학번 또는 비밀번호 오류")
-
-        # 4. 쿠키 저장
-        await save_cookies(context, student_id)
-        logging.debug("[쿠키 저장 성공]")
-        logging.info("[로그인 및 쿠키 저장 완료]")
-        return browser, page
-
-    except Exception as e:
-        logging.error("[예외 발생, 브라우저 종료 중]")
-        logging.error(f"[세션 생성 실패] {e}")
-        import sys
-        import traceback
-        exc_type, exc_value, exc_traceback = sys.exc_info()
-        logging.error("traceback info:")
-        tb_lines = traceback.format_exception(exc_type, exc_value, exc_traceback)
-        for line in tb_lines:
-            logging.error(line.strip())
-        await browser.close()
-        raise
+        try:
+            await _verify_or_login(page, user)
+        finally:
+            await page.close()
+        return await context.cookies(PLATO_URL)
+
+
+async def _verify_or_login(page, user):
+    student_id = user.student_id
+    context = page.context
+
+    # 1️. 쿠키로 우선 시도
+    if await context.cookies(PLATO_URL):
+        logging.debug("[쿠키 기반 로그인 시도]")
+        await goto(page, PLATO_LOGIN_URL, PLATO_LOGIN)
+
+        logout_button = await page.query_selector('button[title=""]:has-text("로그아웃")')
+        if logout_button:
+            logging.info("[쿠키 로그인 성공 (로그아웃 버튼 감지됨)]")
+            session_cache.mark_valid(student_id)
+            return
+        logging.warning("[쿠키 로그인 실패: 로그아웃 버튼 없음]")
+        session_cache.invalidate(student_id)
+        await context.clear_cookies()  # 만료된 쿠키 제거 후 같은 컨텍스트에서 재로그인
+
+    # 2. 실패 시 로그인
+    student_pw = decrypt(user.student_password_encrypted)
+    logging.info("[🔐 수동 로그인 시도]")
+    await goto(page, PLATO_LOGIN_URL, PLATO_LOGIN)
+    logging.debug("[학번 입력 시도]")
+    await page.fill('input[name="username"]', student_id)
+    logging.debug("[비밀번호 입력 시도]")
+    await page.fill('input[name="password"]', student_pw)
+    logging.debug("[로그인 버튼 클릭 후 로드 대기]")
+    await wait_ready(page, PLATO_LOGIN_SUBMIT, lambda: page.click('[name="loginbutton"]'))
+
+    # 3. 로그인 실패 확인
+    if "login.php" in page.url or await page.query_selector("div.loginerrors"):
+        raise Exception("로그인 실패: 학번 또는 비밀번호 오류")
+
+    # 4. 쿠키 저장
+    await save_cookies(context, student_id)
+    session_cache.mark_valid(student_id)
+    logging.debug("[쿠키 저장 성공]")
+    logging.info("[로그인 및 쿠키 저장 완료]")
@@ -1,95 +1,159 @@
-from bs4 import BeautifulSoup
-from utils.end_time_calculator import calc_end_time
+import logging
 import re
+from functools import lru_cache
+
+from bs4 import SoupStrainer
+from utils.end_time_calculator import calc_end_time
+from utils.html_parser import make_soup
+
+# onestop 결과 테이블(#resultTbody)의 열 위치
+COL_NAME = 6      # 교과목명 (헤더에서 찾지 못했을 때 사용)
+COL_CODE = 7      # 교과목번호
+COL_SECTION = 8   # 분반
+COL_TIME = 11     # 시간표(요일/시간/강의실)
+
+# 결과 행만 필요한 경우 / 헤더(열 이름)까지 필요한 경우
+RESULT_ROWS = SoupStrainer("tbody", id="resultTbody")
+RESULT_TABLES = SoupStrainer("table")
+
+SECTION_RE = re.compile(r"(\d{3}(?:\.\d+/\d+)?)")
+
+# 시간표 칸의 네 가지 형식을 한 번에 인식하는 토큰 정규식
+TIME_TOKEN_RE = re.compile(
+    # 형식 1: 시간범위형 (ex. 화 15:00-19:00 401-526)
+    r"(?P<range>(?P<r_day>[월화수목금토])\s+(?P<r_start>\d{2}:\d{2})-(?P<r_end>\d{2}:\d{2})\s+(?P<r_loc>[\w\-가-힣\d]+))"
+    # 형식 2: 시간(분)형 (ex. 월 13:00(75) 313-106)
+    r"|(?P<minutes>(?P<m_day>[월화수목금토])\s+(?P<m_start>\d{2}:\d{2})\((?P<m_len>\d+)\)\s+(?P<m_loc>[가-힣A-Za-z0-9\-]+))"
+    # 형식 3: 사이버수업 (ex. 토 사이버수업)
+    r"|(?P<cyber>(?P<c_day>[월화수목금토])\s+사이버수업)"
+    # 형식 4: 1.5/3 시간 처리 (ZE1000115 관련)
+    r"|(?P<fraction>(?P<f_day>[월화수목금토])\s+(?P<f_time>\d+(?:\.\d+/\d+)?)\s+(?P<f_loc>[\w\-가-힣\d]+))"
+)
 
 def parse_schedule(html, course_code, section_number):
-    """강의 시간표 HTML에서 강의 시간 정보를 파싱합니다."""
-    soup = BeautifulSoup(html, 'html.parser')
+    """
+    강의 시간표 HTML(조회 결과 테이블)에서 해당 분반의 강의 시간 정보를 파싱합니다.
+    분반 행이 없으면 None (행은 있는데 시간표 칸이 비었으면 빈 리스트).
+    """
+    soup = make_soup(html, RESULT_ROWS)
     rows = soup.select('#resultTbody > tr')
-    print(f"[ROWS] 총 {len(rows)}개 발견됨")
+    course_code = course_code.strip()
+    section_number = section_number.strip()
+    logging.debug(f"[시간표 파싱] {course_code}-{section_number}: 행 {len(rows)}개")
 
+    found = False
     results = []
 
-    for i, row in enumerate(rows):
+    for row in rows:
         tds = row.find_all('td')
         if len(tds) < 12:
             continue
 
-        raw_code = tds[7].get_text(strip=True)
-        raw_section = tds[8].get_text(strip=True)
-        section_match = re.match(r"(\d{3}(?:\.\d+/\d+)?)", raw_section)
-        section = section_match.group(1) if section_match else raw_section.strip()
-
-        code = raw_code.strip()
-        course_code = course_code.strip()
-        section_number = section_number.strip()
-
-        print(f"[ {i+1}번 ROW] code={code} vs {course_code}, section={section} vs {section_number}")
+        code = tds[COL_CODE].get_text(strip=True)
+        raw_section = tds[COL_SECTION].get_text(strip=True)
+        section_match = SECTION_RE.match(raw_section)
+        section = section_match.group(1) if section_match else raw_section
 
         if code != course_code or section != section_number:
-            print(f"[걸러짐] {code}-{section}")
             continue
 
-        time_text = tds[11].get_text(separator=" ", strip=True)
-        print("[시간 정보 원문]:", time_text)
-
-        parsed_blocks = []
-
-        # 형식 1: 시간범위형 (ex. 화 15:00-19:00 401-526)
-        range_blocks = re.findall(
-            r"([월화수목금토])\s+(\d{2}:\d{2})-(\d{2}:\d{2})\s+([\w\-가-힣\d]+)", time_text
-        )
-        for weekday, start, end, location in range_blocks:
-            duration = (
-                (int(end.split(":")[0]) * 60 + int(end.split(":")[1]))
-                - (int(start.split(":")[0]) * 60 + int(start.split(":")[1]))
-            )
-            parsed_blocks.append({
-                "weekday": weekday,
+        found = True
+        time_text = tds[COL_TIME].get_text(separator=" ", strip=True)
+        parsed_blocks = parse_time_text(time_text)
+        logging.debug(f"[시간표 파싱] {code}-{section} 원문={time_text!r} → 블록 {len(parsed_blocks)}개")
+        results.extend(parsed_blocks)
+
+    logging.debug(f"[시간표 파싱] {course_code}-{section_number}: 결과 {len(results)}개")
+    return results if found else None
+
+
+def parse_time_text(time_text):
+    """
+    시간표 칸의 원문(예: "화 15:00-19:00 401-526")을 요일/시간/장소 블록 목록으로 변환.
+    같은 원문은 분반/학생이 달라도 반복해서 나오므로 토큰화 결과를 캐시하고, 호출마다 복사본을 돌려준다.
+    """
+    return [dict(block) for _, block in _tokenize_time_text(time_text)]
+
+
+@lru_cache(maxsize=4096)
+def _tokenize_time_text(time_text):
+    """TIME_TOKEN_RE 한 번의 스캔으로 네 가지 형식을 모두 인식. (형식 이름, 블록) 튜플로 반환 (형식 이름은 로그용)"""
+    blocks = []
+    for m in TIME_TOKEN_RE.finditer(time_text):
+        kind = m.lastgroup
+        if kind == "range":
+            start, end = m.group("r_start"), m.group("r_end")
+            blocks.append((kind, {
+                "weekday": m.group("r_day"),
                 "start_time": start,
                 "end_time": end,
-                "duration": duration,
-                "location": location
-            })
-
-        # 형식 2: 시간(분)형 (ex. 월 13:00(75) 313-106)
-        time_blocks = re.findall(
-            r"([월화수목금토])\s+(\d{2}:\d{2})\((\d+)\)\s+([가-힣A-Za-z0-9\-]+)", time_text
-        )
-        for weekday, start, duration, location in time_blocks:
-            end_time = calc_end_time(start, int(duration))
-            parsed_blocks.append({
-                "weekday": weekday,
+                "duration": _minutes(end) - _minutes(start),
+                "location": m.group("r_loc"),
+            }))
+        elif kind == "minutes":
+            start, duration = m.group("m_start"), int(m.group("m_len"))
+            blocks.append((kind, {
+                "weekday": m.group("m_day"),
                 "start_time": start,
-                "end_time": end_time,
-                "duration": int(duration),
-                "location": location
-            })
-
-        # 형식 3: 사이버수업 (ex. 토 사이버수업)
-        cyber_blocks = re.findall(r"([월화수목금토])\s+사이버수업", time_text)
-        for weekday in cyber_blocks:
-            parsed_blocks.append({
-                "weekday": weekday,
+                "end_time": calc_end_time(start, duration),
+                "duration": duration,
+                "location": m.group("m_loc"),
+            }))
+        elif kind == "cyber":
+            blocks.append((kind, {
+                "weekday": m.group("c_day"),
                 "start_time": None,
                 "end_time": None,
                 "duration": None,
-                "location": "사이버수업"
-            })
-
-        # 형식 4: 1.5/3 시간 처리 (ZE1000115 관련)
-        new_blocks = re.findall(r"([월화수목금토])\s+(\d+(?:\.\d+/\d+)?)\s+([\w\-가-힣\d]+)", time_text)
-        for weekday, time_info, location in new_blocks:
-            parsed_blocks.append({
-                "weekday": weekday,
-                "start_time": time_info,  # 임시로 시간 정보를 start_time에 저장
+                "location": "사이버수업",
+            }))
+        else:
+            blocks.append((kind, {
+                "weekday": m.group("f_day"),
+                "start_time": m.group("f_time"),  # 임시로 시간 정보를 start_time에 저장
                 "end_time": None,
                 "duration": None,
-                "location": location
-            })
+                "location": m.group("f_loc"),
+            }))
+    logging.debug(f"[시간표 토큰화] {time_text!r} → {[kind for kind, _ in blocks]}")
+    return tuple(blocks)
 
-        print("[추출 결과]:", parsed_blocks)
-        results.extend(parsed_blocks)
 
-    print("[최종 결과]:", results)
+def _minutes(hhmm):
+    hours, minutes = hhmm.split(":")
+    return int(hours) * 60 + int(minutes)
+
+
+def _header_index(soup, keywords, default):
+    """결과 테이블 헤더에서 keywords 중 하나를 포함하는 열의 위치를 찾음. 없으면 default."""
+    tbody = soup.select_one('#resultTbody')
+    table = tbody.find_parent('table') if tbody else None
+    if table:
+        for i, th in enumerate(table.select('thead th')):
+            if any(k in th.get_text(strip=True) for k in keywords):
+                return i
+    return default
+
+
+def parse_catalog_rows(html):
+    """
+    onestop 강좌 조회 결과의 모든 행을 파싱 (학기 전체 수집용).
+    각 행: {"code", "section", "name", "blocks"} (blocks는 parse_time_text 결과)
+    """
+    soup = make_soup(html, RESULT_TABLES)
+    name_col = _header_index(soup, ("교과목명", "과목명"), COL_NAME)
+
+    results = []
+    for row in soup.select('#resultTbody > tr'):
+        tds = row.find_all('td')
+        if len(tds) < 12:
+            continue
+        raw_section = tds[COL_SECTION].get_text(strip=True)
+        section_match = SECTION_RE.match(raw_section)
+        results.append({
+            "code": tds[COL_CODE].get_text(strip=True),
+            "section": section_match.group(1) if section_match else raw_section,
+            "name": tds[name_col].get_text(strip=True) if name_col < len(tds) else "",
+            "blocks": parse_time_text(tds[COL_TIME].get_text(separator=" ", strip=True)),
+        })
     return results
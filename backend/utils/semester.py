@@ -0,0 +1,14 @@
+from utils.timezone_stabilizer import now_kst
+
+def current_semester(today=None):
+    """
+    오늘(KST) 기준 학기 문자열을 반환. (예: "2025-1")
+    - 3~8월: 해당 연도 1학기
+    - 9~12월: 해당 연도 2학기, 1~2월: 전년도 2학기
+    """
+    today = today or now_kst().date()
+    if 3 <= today.month <= 8:
+        return f"{today.year}-1"
+    if today.month >= 9:
+        return f"{today.year}-2"
+    return f"{today.year - 1}-2"
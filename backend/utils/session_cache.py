@@ -0,0 +1,46 @@
+import logging
+import time
+
+from config.config import settings
+
+
+class SessionValidityCache:
+    """
+    학번별로 PLATO 세션(쿠키)이 마지막으로 유효하다고 확인된 시각을 기억하는 캐시.
+    ttl초 이내에 확인된 세션은 login.php 확인 없이 바로 사용한다.
+    """
+
+    def __init__(self, ttl):
+        self.ttl = ttl
+        self._verified_at = {}
+
+    def is_valid(self, student_id):
+        verified_at = self._verified_at.get(student_id)
+        if verified_at is None:
+            return False
+        if time.monotonic() - verified_at > self.ttl:
+            del self._verified_at[student_id]
+            return False
+        return True
+
+    def last_verified(self, student_id):
+        """마지막 확인 시각(time.monotonic 기준). 기록이 없으면 None."""
+        return self._verified_at.get(student_id)
+
+    def mark_valid(self, student_id):
+        self._verified_at[student_id] = time.monotonic()
+
+    def invalidate(self, student_id):
+        if self._verified_at.pop(student_id, None) is not None:
+            logging.info(f"[세션 캐시 무효화] student_id={student_id}")
+
+    def watch(self, page, student_id):
+        """page가 login.php로 이동하면(세션 만료) 캐시를 무효화하도록 연결한다."""
+        def on_navigated(frame):
+            if frame == page.main_frame and "login.php" in frame.url:
+                self.invalidate(student_id)
+
+        page.on("framenavigated", on_navigated)
+
+
+session_cache = SessionValidityCache(ttl=settings.PLATO_SESSION_TTL)
@@ -0,0 +1,31 @@
+import asyncio
+
+
+class SingleFlight:
+    """
+    같은 key로 동시에 들어온 작업을 하나로 합친다.
+    먼저 온 호출만 실제로 fn()을 실행하고, 나머지는 그 결과(또는 예외)를 함께 받는다.
+    """
+
+    def __init__(self):
+        self._calls = {}
+
+    async def do(self, key, fn):
+        """(결과, 다른 호출의 결과를 공유했는지 여부)를 반환."""
+        task = self._calls.get(key)
+        if task is not None:
+            return await asyncio.shield(task), True
+
+        task = asyncio.ensure_future(fn())
+        self._calls[key] = task
+
+        # 먼저 온 호출이 취소돼도 작업은 계속되므로, 키는 작업이 끝날 때 정리
+        def _forget(_):
+            if self._calls.get(key) is task:
+                del self._calls[key]
+
+        task.add_done_callback(_forget)
+        return await asyncio.shield(task), False
+
+    def in_flight(self, key):
+        return key in self._calls
@@ -0,0 +1,54 @@
+import { secureFetch, secureFetchJson } from "./auth";
+
+const baseUrl = import.meta.env.VITE_API_BASE_URL || "";
+
+// SSE 텍스트 덩어리에서 완성된 이벤트들을 꺼내고, 남은 조각을 돌려줌
+const parseSseChunk = (buffer) => {
+  const events = [];
+  const blocks = buffer.split("\n\n");
+  const rest = blocks.pop();
+  for (const block of blocks) {
+    let event = "message";
+    let data = "";
+    for (const line of block.split("\n")) {
+      if (line.startsWith("event:")) event = line.slice(6).trim();
+      else if (line.startsWith("data:")) data += line.slice(5).trim();
+    }
+    if (data) events.push({ event, data: JSON.parse(data) });
+  }
+  return { events, rest };
+};
+
+/**
+ * 강의/시간표 동기화 작업을 시작하고 끝날 때까지 진행 이벤트를 받음.
+ * onProgress(event)는 강의별 진행 상황마다 호출된다.
+ * 반환값은 기존 /api/lectures/update 응답과 같은 형태({status, message, lectures}).
+ */
+export const runLectureSync = async (onProgress) => {
+  const job = await secureFetchJson(`${baseUrl}/api/lectures/update`, { method: "POST" });
+  if (!job || !job.job_id) return job;
+
+  // Authorization 헤더가 필요해서 EventSource 대신 fetch 스트림으로 SSE를 읽음
+  const res = await secureFetch(`${baseUrl}/api/lectures/update/${job.job_id}/events`);
+  if (!res || !res.body) return null;
+
+  const reader = res.body.getReader();
+  const decoder = new TextDecoder();
+  let buffer = "";
+  for (;;) {
+    const { value, done } = await reader.read();
+    if (done) break;
+    buffer += decoder.decode(value, { stream: true });
+    const { events, rest } = parseSseChunk(buffer);
+    buffer = rest;
+    for (const { event, data } of events) {
+      if (event === "progress") {
+        onProgress?.(data);
+      } else if (event === "done") {
+        if (data.status === "success") return data.result;
+        return { status: "failed", message: data.error || "강의 업데이트 중 오류 발생" };
+      }
+    }
+  }
+  return { status: "failed", message: "업데이트 진행 상황을 받지 못했습니다." };
+};
@@ -1,9 +1,22 @@
-import React, { useState, useEffect } from 'react';
-import { moveToKeywordOnMap } from '../utils/mapUtils';
+import React, { useState, useEffect, useRef } from 'react';
+import { secureFetchJson } from '../api/auth';
+
+const baseUrl = import.meta.env.VITE_API_BASE_URL || "";
+
+// 입력이 멈춘 뒤 이 시간(ms)이 지나면 자동완성 요청
+const SUGGEST_DELAY = 120;
+
+// 카카오 키워드 검색이 학교 밖의 같은 이름 건물(학생회관 등)로 가지 않도록 학교/캠퍼스 이름을 붙임
+const mapKeyword = (place) => {
+  const campus = place.campus && place.campus !== '부산' ? `${place.campus}캠퍼스 ` : '';
+  return `부산대학교 ${campus}${place.building_name || place.building_code}`;
+};
 
 const SearchBarWithSuggestions = ({ onSelect, externalValue }) => {
   const [input, setInput] = useState('');
   const [suggestions, setSuggestions] = useState([]);
+  const timerRef = useRef(null);
+  const abortRef = useRef(null);
 
   // 외부에서 값이 바뀌면 input도 동기화
   useEffect(() => {
@@ -12,33 +25,45 @@ const SearchBarWithSuggestions = ({ onSelect, externalValue }) => {
     }
   }, [externalValue]);
 
+  useEffect(() => () => {
+    clearTimeout(timerRef.current);
+    abortRef.current?.abort();
+  }, []);
+
+  // 서버의 건물/강의실 색인에서 자동완성 (초성 검색 지원)
+  const fetchSuggestions = async (value) => {
+    abortRef.current?.abort();
+    const controller = new AbortController();
+    abortRef.current = controller;
+    try {
+      const data = await secureFetchJson(
+        `${baseUrl}/api/locations/search?q=${encodeURIComponent(value)}&limit=5`,
+        { signal: controller.signal }
+      );
+      setSuggestions(data?.results || []);
+    } catch (err) {
+      if (err.name !== 'AbortError') setSuggestions([]);
+    }
+  };
+
   const handleInput = (e) => {
     const value = e.target.value;
     setInput(value);
+    clearTimeout(timerRef.current);
 
     if (!value.trim()) {
+      abortRef.current?.abort();
       setSuggestions([]);
       return;
     }
-
-    if (window.kakao && window.kakao.maps && window.kakao.maps.services) {
-      const ps = new window.kakao.maps.services.Places();
-      const query = "부산대학교 " + value.replace(/^부산대학교\s*/, "");
-      ps.keywordSearch(query, function (data, status) {
-        if (status === window.kakao.maps.services.Status.OK) {
-          setSuggestions(data.slice(0, 5));
-        } else {
-          setSuggestions([]);
-        }
-      });
-    }
+    timerRef.current = setTimeout(() => fetchSuggestions(value.trim()), SUGGEST_DELAY);
   };
 
   const handleSuggestionClick = (place) => {
-    setInput(place.place_name);
+    setInput(place.label);
     setSuggestions([]);
-    moveToKeywordOnMap(place.place_name);
-    if (onSelect) onSelect(place.place_name);
+    // 지도는 건물 단위로 이동 (MapView가 keyword로 위치를 찾음)
+    if (onSelect) onSelect(mapKeyword(place));
   };
 
   return (
@@ -52,13 +77,16 @@ const SearchBarWithSuggestions = ({ onSelect, externalValue }) => {
       />
       {suggestions.length > 0 && (
         <div className="suggestion-list">
-          {suggestions.map((place, idx) => (
+          {suggestions.map((place) => (
             <div
-              key={idx}
+              key={`${place.building_code}-${place.room || ''}`}
               className="suggestion-list-item"
               onClick={() => handleSuggestionClick(place)}
             >
-              {place.place_name}
+              {place.label}
+              <span style={{ color: '#999', marginLeft: 6, fontSize: '0.85em' }}>
+                {place.room ? `${place.building_code}-${place.room}` : place.building_code}
+              </span>
             </div>
           ))}
         </div>
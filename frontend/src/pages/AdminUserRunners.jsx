@@ -50,6 +50,8 @@ const AdminUserRunners = () => {
   const [attendances, setAttendances] = useState([]);
   const [attLoading, setAttLoading] = useState(false);
   const [attMsg, setAttMsg] = useState('');
+  const [attCursor, setAttCursor] = useState(null);
+  const [attTotal, setAttTotal] = useState(0);
 
   // 사용자 강의 및 자동출석 강의 동기화
   const fetchUserData = async () => {
@@ -120,23 +122,29 @@ const AdminUserRunners = () => {
     }
   };
 
-  // 사용자 출석 기록 조회
-  const fetchAttendances = async () => {
+  // 사용자 출석 기록 조회 (cursor가 있으면 다음 페이지를 이어 붙임)
+  const fetchAttendances = async (cursor = null) => {
     if (!userId) return;
     setAttLoading(true);
-    setAttMsg('');
-    setAttendances([]);
+    if (!cursor) {
+      setAttMsg('');
+      setAttendances([]);
+      setAttCursor(null);
+    }
     try {
-      const res = await secureFetchJson(`${baseUrl}/api/admin/users/${userId}/attendances`);
+      const query = cursor ? `?cursor=${encodeURIComponent(cursor)}` : '';
+      const res = await secureFetchJson(`${baseUrl}/api/admin/users/${userId}/attendances${query}`);
       if (res.status === 'success') {
-        setAttendances(res.attendances || []);
-        setAttMsg(`총 ${res.count}건`);
+        setAttendances(prev => (cursor ? [...prev, ...(res.attendances || [])] : (res.attendances || [])));
+        setAttCursor(res.next_cursor || null);
+        setAttTotal(res.total);
+        setAttMsg(`총 ${res.total}건`);
       } else {
-        setAttendances([]);
+        if (!cursor) setAttendances([]);
         setAttMsg('출석 기록 조회 실패');
       }
     } catch {
-      setAttendances([]);
+      if (!cursor) setAttendances([]);
       setAttMsg('출석 기록 조회 실패');
     } finally {
       setAttLoading(false);
@@ -194,7 +202,7 @@ const AdminUserRunners = () => {
             조회
           </button>
           <button
-            onClick={fetchAttendances}
+            onClick={() => fetchAttendances()}
             disabled={!userId || attLoading}
             style={{
               background: "#f59e42",
@@ -246,6 +254,14 @@ const AdminUserRunners = () => {
                 </table>
               </div>
             )}
+            {attCursor && !attLoading && (
+              <button
+                onClick={() => fetchAttendances(attCursor)}
+                style={{ marginTop: 8, background: "none", border: "1px solid #f59e42", color: "#f59e42", borderRadius: 7, padding: "5px 16px", fontWeight: 600, cursor: "pointer" }}
+              >
+                더 보기 ({attendances.length}/{attTotal})
+              </button>
+            )}
             {!attLoading && attendances.length === 0 && attMsg && (
               <div style={{ color: "#888" }}>출석 기록이 없습니다.</div>
             )}
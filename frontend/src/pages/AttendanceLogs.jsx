@@ -1,8 +1,11 @@
-import React, { useEffect, useState } from 'react';
+import React, { useCallback, useEffect, useRef, useState } from 'react';
 import { secureFetchJson } from '../api/auth';
 
 const baseUrl = import.meta.env.VITE_API_BASE_URL || "";
 
+// 한 번에 불러올 기록 수 (스크롤이 목록 끝에 닿으면 다음 페이지)
+const PAGE_SIZE = 50;
+
 const TYPE_LABELS = {
   0: { label: "일반 출석", color: "#1976d2" },
   1: { label: "Pro 수동 출석", color: "#ff9800" },
@@ -29,30 +32,55 @@ const toKSTString = (log) => {
 const AttendanceLogs = () => {
   const [logs, setLogs] = useState([]);
   const [loading, setLoading] = useState(true);
+  const [loadingMore, setLoadingMore] = useState(false);
+  const [nextCursor, setNextCursor] = useState(null);
+  const [total, setTotal] = useState(0);
+  const sentinelRef = useRef(null);
 
-  useEffect(() => {
-    const fetchLogs = async () => {
-      setLoading(true);
-      try {
-        const res = await secureFetchJson(`${baseUrl}/api/attendance/logs`);
-        if (res?.status === 'success') {
-          setLogs(res.attendances || []);
-        } else {
-          setLogs([]);
-        }
-      } catch {
-        setLogs([]);
-      } finally {
-        setLoading(false);
+  const fetchLogs = useCallback(async (cursor = null) => {
+    const setBusy = cursor ? setLoadingMore : setLoading;
+    setBusy(true);
+    try {
+      const query = `limit=${PAGE_SIZE}` + (cursor ? `&cursor=${encodeURIComponent(cursor)}` : '');
+      const res = await secureFetchJson(`${baseUrl}/api/attendance/logs?${query}`);
+      if (res?.status === 'success') {
+        setLogs(prev => (cursor ? [...prev, ...(res.attendances || [])] : (res.attendances || [])));
+        setNextCursor(res.next_cursor || null);
+        setTotal(res.total ?? 0);
+      } else {
+        if (!cursor) setLogs([]);
+        setNextCursor(null);
       }
-    };
-    fetchLogs();
+    } catch {
+      if (!cursor) setLogs([]);
+      setNextCursor(null);
+    } finally {
+      setBusy(false);
+    }
   }, []);
 
+  useEffect(() => {
+    fetchLogs();
+  }, [fetchLogs]);
+
+  // 목록 끝의 sentinel이 보이면 다음 페이지 요청
+  useEffect(() => {
+    const sentinel = sentinelRef.current;
+    if (!sentinel || !nextCursor || loadingMore) return;
+    const observer = new IntersectionObserver((entries) => {
+      if (entries[0].isIntersecting) fetchLogs(nextCursor);
+    }, { rootMargin: '200px' });
+    observer.observe(sentinel);
+    return () => observer.disconnect();
+  }, [nextCursor, loadingMore, fetchLogs]);
+
   return (
     <div className="page-bg">
       <div className="card" style={{ maxWidth: 900, margin: "40px auto", padding: 32, minHeight: 400 }}>
-        <h1 style={{ color: "#444", fontWeight: 800, fontSize: "1.3em", marginBottom: 18 }}>내 SuperPlato 출석 기록</h1>
+        <h1 style={{ color: "#444", fontWeight: 800, fontSize: "1.3em", marginBottom: 18 }}>
+          내 SuperPlato 출석 기록
+          {total > 0 && <span style={{ color: "#888", fontWeight: 500, fontSize: "0.75em", marginLeft: 8 }}>총 {total}건</span>}
+        </h1>
         {loading ? (
           <div style={{ color: "#888" }}>불러오는 중...</div>
         ) : logs.length === 0 ? (
@@ -109,7 +137,7 @@ const AttendanceLogs = () => {
               </thead>
               <tbody>
                 {logs.map((log, idx) => (
-                  <tr key={idx} style={{
+                  <tr key={log.attendance_id} style={{
                     background: idx % 2 === 0 ? "#fff" : "#f4f7fb"
                   }}>
                     <td style={{
@@ -166,6 +194,18 @@ const AttendanceLogs = () => {
                 ))}
               </tbody>
             </table>
+            <div ref={sentinelRef} />
+            {loadingMore && <div style={{ color: "#888", padding: 12, textAlign: "center" }}>불러오는 중...</div>}
+            {nextCursor && !loadingMore && (
+              <div style={{ textAlign: "center", padding: 12 }}>
+                <button
+                  onClick={() => fetchLogs(nextCursor)}
+                  style={{ background: "none", border: "1px solid #2563eb", color: "#2563eb", borderRadius: 8, padding: "6px 18px", fontWeight: 600, cursor: "pointer" }}
+                >
+                  더 보기 ({logs.length}/{total})
+                </button>
+              </div>
+            )}
           </div>
         )}
       </div>
@@ -1,6 +1,7 @@
 import React, { useEffect, useState } from 'react';
 import { useNavigate } from 'react-router-dom';
 import { secureFetchJson } from '../api/auth';
+import { runLectureSync } from '../api/lectures';
 import LectureList from '../components/LectureList';
 import BuildingButtonGroup from '../components/BuildingButtonGroup';
 import MapView from '../components/MapView';
@@ -50,7 +51,7 @@ const ManageLectures = () => {
     if (!window.confirm('정말로 강의 목록을 업데이트하시겠습니까?')) return;
     setLoading(true);
     try {
-      const result = await secureFetchJson(`${baseUrl}/api/lectures/update`, { method: 'POST' });
+      const result = await runLectureSync();
       if (!result || result.status === 'forbidden') {
         alert('로그인이 필요합니다. 다시 로그인 해주세요.');
         return;
@@ -1,6 +1,7 @@
 import React, { useState, useEffect, useRef } from 'react';
 import { useNavigate } from 'react-router-dom';
 import { secureFetchJson } from '../api/auth';
+import { runLectureSync } from '../api/lectures';
 
 const baseUrl = import.meta.env.VITE_API_BASE_URL || "";
 
@@ -66,7 +67,7 @@ const Onboarding = () => {
   const handleLectureUpdate = async () => {
     setLoading(true);
     try {
-      const res = await secureFetchJson(`${baseUrl}/api/lectures/update`, { method: 'POST' });
+      const res = await runLectureSync();
       if (res?.status === 'success') {
         setStep(3);
         setTimeout(() => {